@@ -0,0 +1,172 @@
+"""
+Memory of forked workers serving historical boards, the way a pre-forking server (gunicorn, uvicorn --workers) runs.
+
+    python benchmarks/bench_fork_memory.py
+    python benchmarks/bench_fork_memory.py --workers 8 --mode shared
+
+Every worker is forked from one parent, then queries every static board. Modes:
+
+    lazy       each worker loads its own boards (the default client)
+    lazy-rows  each worker maps its own boards, rows decoded on access (lazy_static=True)
+    shared     the parent maps the boards once with caching.share_static(), workers use the SHARED policy
+
+Private is the memory only that worker holds (Private_Clean + Private_Dirty), PSS splits shared pages between the
+processes using them. Linux only, both are read from /proc/self/smaps_rollup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from the_finals_leaderboard import api, caching, client
+
+MODES = ("lazy", "lazy-rows", "shared")
+
+_ROLLUP = Path("/proc/self/smaps_rollup")
+
+
+def _rollup() -> dict[str, int]:
+    """Kilobytes per field."""
+
+    values: dict[str, int] = {}
+    for line in _ROLLUP.read_text().splitlines()[1:]:
+        name, _, rest = line.partition(":")
+        values[name] = int(rest.split()[0])
+    return values
+
+
+def _private(rollup: dict[str, int]) -> int:
+    return rollup["Private_Clean"] + rollup["Private_Dirty"]
+
+
+def static_boards() -> list[tuple[api.Leaderboard, api.Platform | None]]:
+    fnames = set(caching.list_static_fname())
+    boards = []
+    for leaderboard, platforms in api.LEADERBOARD_PLATFORM_MAP.items():
+        for platform in platforms or (None,):
+            if caching.static_fname(leaderboard, platform) in fnames:
+                boards.append((leaderboard, platform))
+    return boards
+
+
+def workload(c: client.Client, boards: list[tuple[api.Leaderboard, api.Platform | None]]):
+    # A full read, a filtered read and a page of players per board.
+    for leaderboard, platform in boards:
+        result = c.get_leaderboard_sync(leaderboard, platform)
+        c.get_leaderboard_sync(leaderboard, platform, rank__lte=500)
+        for player in result.players[:100]:
+            player.name
+
+
+def _worker(mode: str, boards: list[tuple[api.Leaderboard, api.Platform | None]], out: int):
+    before = _rollup()
+    if mode == "shared":
+        c = client.Client(static_caching_policy=client.StaticCachingPolicy.SHARED)
+    else:
+        c = client.Client(lazy_static=mode == "lazy-rows")
+
+    workload(c, boards)
+    workload(c, boards)  # Warm, nothing new should be loaded
+    after = _rollup()
+
+    os.write(out, json.dumps({
+        "private": _private(after),
+        "private_growth": _private(after) - _private(before),
+        "pss": after["Pss"],
+    }).encode("utf-8"))
+
+
+def run(mode: str, workers: int) -> list[dict[str, int]]:
+    boards = static_boards()
+    if mode == "shared":
+        caching.share_static()
+
+    children: list[tuple[int, int]] = []
+    for _ in range(workers):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            status = 0
+            try:
+                _worker(mode, boards, write)
+            except BaseException:
+                status = 1
+                import traceback
+                traceback.print_exc()
+            finally:
+                os._exit(status)
+        os.close(write)
+        children.append((pid, read))
+
+    # Workers stay alive until all of them are done, so PSS reflects the pages they share.
+    stats = []
+    for pid, read in children:
+        with os.fdopen(read, "rb") as fp:
+            data = fp.read()
+        _, status = os.waitpid(pid, 0)
+        if status != 0:
+            raise RuntimeError(f"Worker {pid} failed")
+        stats.append(json.loads(data))
+    return stats
+
+
+def _measure(mode: str, workers: int) -> list[dict[str, int]]:
+    # Each mode runs from a fresh parent, so one mode's mappings and frozen objects don't leak into the next.
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        status = 0
+        try:
+            os.write(write, json.dumps(run(mode, workers)).encode("utf-8"))
+        except BaseException:
+            status = 1
+            import traceback
+            traceback.print_exc()
+        finally:
+            os._exit(status)
+
+    os.close(write)
+    with os.fdopen(read, "rb") as fp:
+        data = fp.read()
+    _, status = os.waitpid(pid, 0)
+    if status != 0:
+        raise RuntimeError(f"Benchmark of {mode} failed")
+    return json.loads(data)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mode", dest="modes", action="append", choices=MODES, help="Only run this mode, may be repeated")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, "fork") or not _ROLLUP.exists():
+        print("Needs fork and /proc/self/smaps_rollup (Linux)", file=sys.stderr)
+        return 1
+
+    results = {}
+    print(f"{'mode':<10} {'workers':>7} {'private/worker':>15} {'growth/worker':>14} {'total private':>14} {'total pss':>10}")
+    for mode in args.modes or MODES:
+        stats = results[mode] = _measure(mode, args.workers)
+        private = sum(s["private"] for s in stats)
+        growth = sum(s["private_growth"] for s in stats)
+        pss = sum(s["pss"] for s in stats)
+        print(
+            f"{mode:<10} {len(stats):>7} {private / len(stats) / 1024:>12.1f} MB {growth / len(stats) / 1024:>11.1f} MB"
+            f" {private / 1024:>11.1f} MB {pss / 1024:>7.1f} MB"
+        )
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Import and construction time budgets, each measured in a fresh interpreter.
+
+    python benchmarks/bench_import.py
+
+Exits with a non-zero status if the fastest run of any measurement is over its budget, the fastest run is the one
+least affected by whatever else the machine is doing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Milliseconds, with some headroom for a slow CI runner. Most of client_import is pydantic building the user models.
+BUDGETS = {
+    "import": 20.0,
+    "client_import": 150.0,
+    "client_construct": 5.0,
+}
+
+# Dependencies are imported first, so the budgets cover this package and not the versions of httpx and pydantic.
+_PROBE = """
+import json, time
+import asyncio, httpx
+from pydantic import BaseModel, field_validator, model_validator
+t0 = time.perf_counter()
+import the_finals_leaderboard
+t1 = time.perf_counter()
+Client = the_finals_leaderboard.Client
+t2 = time.perf_counter()
+Client()
+t3 = time.perf_counter()
+print(json.dumps({
+    "import": (t1 - t0) * 1000,
+    "client_import": (t2 - t1) * 1000,
+    "client_construct": (t3 - t2) * 1000,
+}))
+"""
+
+
+def measure(runs: int) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {name: [] for name in BUDGETS}
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _PROBE], check=True, capture_output=True, text=True).stdout
+        for name, value in json.loads(out).items():
+            samples[name].append(value)
+    return samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, values in measure(args.runs).items():
+        median = statistics.median(values)
+        ok = min(values) <= BUDGETS[name]
+        failed |= not ok
+        print(f"{name:<18} median {median:8.2f} ms  min {min(values):8.2f} ms  budget {BUDGETS[name]:6.0f} ms  {'ok' if ok else 'OVER'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Time and peak memory of the hot paths, per board size. Runs offline, live boards are served by a local stub server.
+
+    python benchmarks/bench_paths.py
+    python benchmarks/bench_paths.py -k 'filter*' --repeat 10 --json results.json
+
+Patterns given with -k are matched against both benchmark and group names.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))  # The stub server is shared with the tests
+
+import harness  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+from the_finals_leaderboard import api, caching, client, database, filtering  # noqa: E402
+
+SIZES = (100, 1000, 10000)
+
+# Board used for the size dependent benchmarks.
+SIZED_BOARD = api.Leaderboard.S8
+
+# One filter per operator in filtering.OPS, on fields that exist in every sized board.
+OP_FILTERS: dict[str, dict[str, Any]] = {
+    "exact": {"club_tag__exact": "ALLOR"},
+    "iexact": {"club_tag__iexact": "allor"},
+    "contains": {"name__contains": "Palma"},
+    "icontains": {"name__icontains": "palma"},
+    "startswith": {"name__startswith": "ALL"},
+    "istartswith": {"name__istartswith": "all"},
+    "endswith": {"name__endswith": "1"},
+    "iendswith": {"name__iendswith": "1"},
+    "gt": {"rank_score__gt": 40000},
+    "gte": {"rank_score__gte": 40000},
+    "lt": {"rank__lt": 500},
+    "lte": {"rank__lte": 500},
+    "isnull": {"xbox_name__isnull": True},
+    "regex": {"name__regex": r"^[A-Z]{3}_"},
+    "iregex": {"name__iregex": r"^all_"},
+    "exists": {"steam_name__exists": True},
+}
+
+
+def _truncated(data: dict[str, Any], rows: int) -> dict[str, Any]:
+    return {**data, "data": data["data"][:rows]}
+
+
+def add_load(suite: harness.Suite):
+    sizes: dict[int, str] = {}
+    for fname in caching.list_static_fname():
+        rows = len(caching.load_static_fname(fname)["data"])
+        sizes.setdefault(rows, fname)  # One board of each distinct size
+
+    for rows, fname in sorted(sizes.items()):
+        name = fname.removeprefix("leaderboard_").removesuffix(".json.gz")
+        suite.add(f"load_static_fname[{name}]", "load", lambda fname=fname: caching.load_static_fname(fname), rows)
+        suite.add(f"load_static_bytes[{name}]", "load", lambda fname=fname: caching.load_static_bytes(fname), rows)
+        suite.add(f"load_static_binary_fname[{name}]", "load", lambda fname=fname: caching.load_static_binary_fname(fname), rows)
+
+
+def add_validate(suite: harness.Suite):
+    # One board for each distinct user model.
+    seen: set[type] = set()
+    static = set(caching.list_static_fname())
+    for leaderboard, platforms in api.LEADERBOARD_PLATFORM_MAP.items():
+        user_type = api.LEADERBOARD_USER_MAP[leaderboard]
+        fname = caching.static_fname(leaderboard, platforms[0] if platforms else None)
+        if user_type in seen or fname not in static:
+            continue
+        seen.add(user_type)
+
+        data = caching.load_static_fname(fname)
+        body = caching.load_static_bytes(fname)
+        model = api.result_model(leaderboard)
+        rows = len(data["data"])
+        suite.add(f"model_validate[{user_type.__name__}]", "validate", lambda model=model, data=data: model.model_validate(data), rows)
+        suite.add(f"model_validate_json[{user_type.__name__}]", "validate", lambda model=model, body=body: model.model_validate_json(body), rows)
+
+
+def add_filter(suite: harness.Suite):
+    data = caching.load_static(SIZED_BOARD, api.LEADERBOARD_PLATFORM_MAP[SIZED_BOARD][0])
+    model = api.result_model(SIZED_BOARD)
+
+    for size in SIZES:
+        result = model.model_validate(_truncated(data, size))
+        players = result.players
+
+        for op, filters in OP_FILTERS.items():
+            suite.add(f"extended_filter[{op}]", "extended_filter", lambda filters=filters, players=players: filtering.extended_filter(players, **filters), size)
+
+        combined = {"rank_score__gte": 40000, "name__icontains": "a", "xbox_name__isnull": True}
+        suite.add("LeaderboardResult.filter[combined]", "result_filter", lambda result=result: result.filter(**combined), size)
+
+        indexed = model.model_validate(_truncated(data, size))
+        indexed.create_index("club_tag")
+        suite.add("LeaderboardResult.filter[indexed exact]", "result_filter", lambda result=indexed: result.filter(club_tag="ALLOR"), size)
+
+        db = database.LeaderboardDatabase()
+        db.ingest(result)
+        for op, filters in OP_FILTERS.items():
+            suite.add(f"LeaderboardDatabase.query[{op}]", "database", lambda filters=filters, db=db: db.query(SIZED_BOARD, **filters), size)
+
+
+def add_client(suite: harness.Suite, stub: StubServer):
+    live = api.Leaderboard.S9
+    static = SIZED_BOARD
+    rows = len(caching.load_static(static, api.LEADERBOARD_PLATFORM_MAP[static][0])["data"])
+    state: dict[str, client.Client] = {}
+
+    def fresh(**kwargs):
+        def setup():
+            state["client"] = client.Client(url=stub.url, **kwargs)
+        return setup
+
+    def get_sync(leaderboard: api.Leaderboard, ignore_cache: bool = False):
+        return lambda: state["client"].get_leaderboard_sync(leaderboard, None, ignore_cache)
+
+    # Not asyncio.run, restoring its SIGINT handler reprs the finished task, and with it the whole result.
+    loop = asyncio.new_event_loop()
+
+    def get_async(leaderboard: api.Leaderboard):
+        return lambda: loop.run_until_complete(state["client"].get_leaderboard_async(leaderboard))
+
+    warm = client.Client(url=stub.url)
+    warm.get_leaderboard_sync(live)
+    warm.get_leaderboard_sync(static)
+
+    def use_warm():
+        state["client"] = warm
+
+    suite.add("live cold sync", "client", get_sync(live), rows, setup=fresh())
+    suite.add("live cold async", "client", get_async(live), rows, setup=fresh())
+    suite.add("live warm sync", "client", get_sync(live), rows, setup=use_warm)
+    suite.add("live warm async", "client", get_async(live), rows, setup=use_warm)
+    suite.add("live revalidated (304)", "client", get_sync(live, ignore_cache=True), rows, setup=use_warm)
+    suite.add("static cold (lazy policy)", "client", get_sync(static), rows, setup=fresh())
+    suite.add("static cold (lazy_static)", "client", get_sync(static), rows, setup=fresh(lazy_static=True))
+    suite.add("static warm", "client", get_sync(static), rows, setup=use_warm)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="Only run matching benchmarks, may be repeated")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.0, help="Keep repeating (up to 10x --repeat) for at least this many seconds")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated server latency in seconds")
+    args = parser.parse_args(argv)
+
+    with StubServer(latency=args.latency) as stub:
+        suite = harness.Suite()
+        add_load(suite)
+        add_validate(suite)
+        add_filter(suite)
+        add_client(suite, stub)
+
+        results = []
+        for bench in suite.select(args.patterns):
+            results.append(harness.run(bench, args.repeat, args.min_time))
+            print(harness.report(results[-1:]).splitlines()[-1], file=sys.stderr)
+
+    print(harness.report(results))
+    if args.json_path:
+        harness.dump_json(results, args.json_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
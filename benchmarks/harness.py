@@ -0,0 +1,112 @@
+"""Minimal benchmark harness: wall time with `time.perf_counter` and peak allocations with `tracemalloc`."""
+
+from __future__ import annotations
+
+import fnmatch
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+
+@dataclass(slots=True)
+class Benchmark():
+    name: str
+    group: str
+    func: Callable[[], Any]
+    rows: int | None = None
+    setup: Callable[[], Any] | None = None
+
+
+@dataclass(slots=True)
+class Result():
+    name: str
+    group: str
+    rows: int | None
+    runs: int
+    min_ms: float
+    median_ms: float
+    peak_kib: float
+
+
+class Suite():
+    def __init__(self):
+        self.benchmarks: list[Benchmark] = []
+
+    def add(
+        self,
+        name: str,
+        group: str,
+        func: Callable[[], Any],
+        rows: int | None = None,
+        setup: Callable[[], Any] | None = None,
+    ):
+        self.benchmarks.append(Benchmark(name, group, func, rows, setup))
+
+    def select(self, patterns: list[str]) -> list[Benchmark]:
+        if not patterns:
+            return list(self.benchmarks)
+        return [
+            bench
+            for bench in self.benchmarks
+            if any(fnmatch.fnmatch(bench.name, pattern) or fnmatch.fnmatch(bench.group, pattern) for pattern in patterns)
+        ]
+
+
+def run(bench: Benchmark, repeat: int, min_time: float = 0.0) -> Result:
+    if bench.setup is not None:
+        bench.setup()
+    bench.func()  # Warm up, e.g. lazily built schemas
+
+    times: list[float] = []
+    started = time.perf_counter()
+    while len(times) < repeat or (time.perf_counter() - started < min_time and len(times) < repeat * 10):
+        if bench.setup is not None:
+            bench.setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        bench.func()
+        times.append(time.perf_counter() - t0)
+
+    # Measured separately, tracing slows everything down.
+    if bench.setup is not None:
+        bench.setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        bench.func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=bench.name,
+        group=bench.group,
+        rows=bench.rows,
+        runs=len(times),
+        min_ms=min(times) * 1000,
+        median_ms=statistics.median(times) * 1000,
+        peak_kib=peak / 1024,
+    )
+
+
+def report(results: list[Result]) -> str:
+    lines = [f"{'benchmark':<52} {'rows':>6} {'runs':>5} {'min ms':>10} {'median ms':>10} {'peak KiB':>10}"]
+    group = None
+    for result in results:
+        if result.group != group:
+            group = result.group
+            lines.append(f"-- {group}")
+        rows = "" if result.rows is None else str(result.rows)
+        lines.append(
+            f"{result.name:<52} {rows:>6} {result.runs:>5} {result.min_ms:>10.3f} {result.median_ms:>10.3f} {result.peak_kib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def dump_json(results: list[Result], path: str):
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump([asdict(result) for result in results], fp, indent=2)
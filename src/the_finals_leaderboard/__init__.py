@@ -1,3 +1,66 @@
-from .api import Leaderboard, Platform
-from .client import Client, StaticCachingPolicy
-from .models import LeagueNumber, RankedLeague
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import Leaderboard, Platform
+    from .caching import EvictionPolicy
+    from .client import Client, StaticCachingPolicy
+    from .metrics import MetricEvent
+    from .models import LeagueNumber, RankedLeague
+
+# Submodules pull in pydantic (and the client httpx), so they're only imported when first used.
+_LAZY_ATTRIBUTES = {
+    "Leaderboard": "api",
+    "Platform": "api",
+    "EvictionPolicy": "caching",
+    "Client": "client",
+    "StaticCachingPolicy": "client",
+    "MetricEvent": "metrics",
+    "LeagueNumber": "models",
+    "RankedLeague": "models",
+}
+_SUBMODULES = frozenset((
+    "api",
+    "caching",
+    "client",
+    "columnar",
+    "database",
+    "diffing",
+    "filtering",
+    "history",
+    "indexing",
+    "metrics",
+    "models",
+    "streaming",
+    "watching",
+))
+
+__all__ = [
+    "Leaderboard",
+    "Platform",
+    "EvictionPolicy",
+    "Client",
+    "StaticCachingPolicy",
+    "MetricEvent",
+    "LeagueNumber",
+    "RankedLeague",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
@@ -12,10 +12,12 @@ def generate_client():
         "from __future__ import annotations",
         "",
         "import datetime",
+        "from concurrent.futures import Future",
         "from enum import StrEnum",
-        "from typing import Any, Literal, overload",
+        "import random",
+        "from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Literal, overload",
         "",
-        "from the_finals_leaderboard import api, models",
+        "from the_finals_leaderboard import api, caching, database, history, indexing, metrics, models, watching",
         "",
         "",
         "class StaticCachingPolicy(StrEnum):",
@@ -23,17 +25,60 @@ def generate_client():
         "    DISK = \"disk\"",
         "    LAZY = \"lazy\"",
         "    EAGER = \"eager\"",
+        "    SHARED = \"shared\"",
         "",
         "",
         "class Client():",
         "    def __init__(",
         "        self,",
-        "        static_caching_policy: Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, \"disabled\", \"disk\", \"lazy\", \"eager\"] = StaticCachingPolicy.LAZY,",
+        "        static_caching_policy: Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, StaticCachingPolicy.SHARED, \"disabled\", \"disk\", \"lazy\", \"eager\", \"shared\"] = StaticCachingPolicy.LAZY,",
         "        live_caching_ttl: datetime.timedelta | int = datetime.timedelta(minutes=5),",
         "        url: str = \"https://api.the-finals-leaderboard.com\",",
-        "        timeout: float = 10.0",
+        "        timeout: float = 10.0,",
+        "        indexes: Iterable[str] = (),",
+        "        max_staleness: datetime.timedelta | int = datetime.timedelta(0),",
+        "        lazy_static: bool = False,",
+        "        max_cache_entries: int | None = None,",
+        "        max_cache_bytes: int | None = None,",
+        "        eviction_policy: Literal[caching.EvictionPolicy.LRU, caching.EvictionPolicy.LFU, \"lru\", \"lfu\"] = caching.EvictionPolicy.LRU,",
+        "        on_evict: Callable[[str, Any], None] | None = None,",
+        "        preload: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = (),",
+        "        preload_in_background: bool = False,",
+        "        preload_workers: int = 4,",
+        "        metrics: metrics.MetricsHook | None = None,",
+        "        history: history.HistoryStore | None = None,",
+        "        database: database.LeaderboardDatabase | None = None,",
         "    ): ...",
         "",
+        "    @property",
+        "    def ready(self) -> Future[None]: ...",
+        "    async def wait_ready_async(self) -> None: ...",
+        "",
+        "    @property",
+        "    def cache_stats(self) -> caching.CacheStats: ...",
+        "",
+        "    def find_player(self, name: str) -> list[indexing.PlayerAppearance]: ...",
+        "",
+        "    def watch(",
+        "        self,",
+        "        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = api.CURRENT_SEASON_LEADERBOARDS,",
+        "        /,",
+        "        *,",
+        "        interval: datetime.timedelta | int | None = None,",
+        "        jitter: float = 0.1,",
+        "        max_interval: datetime.timedelta | int | None = None,",
+        "        backoff: float = 2.0,",
+        "        max_requests: int | None = None,",
+        "        budget_period: datetime.timedelta | int = datetime.timedelta(minutes=1),",
+        "        clock: Callable[[], float] = ...,",
+        "        sleep: Callable[[float], Awaitable[Any]] = ...,",
+        "        rng: random.Random | None = None,",
+        "    ) -> watching.Watcher: ...",
+        "    async def _poll_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> api.LeaderboardResult[Any]: ...",
+        "",
+        "    def get_leaderboards_sync(self, leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]], ignore_cache: bool = False, /, *, max_workers: int = 8, **filters: Any) -> Iterator[api.LeaderboardResult[Any]]: ...",
+        "    def get_leaderboards_async(self, leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]], ignore_cache: bool = False, /, *, concurrency: int = 8, **filters: Any) -> AsyncIterator[api.LeaderboardResult[Any]]: ...",
+        "",
         "    # The pit of overloads",
         "",
     ]
@@ -57,6 +102,24 @@ def generate_client():
             f"**filters: Any) "
             f"-> api.LeaderboardResult[models.{value.__name__}]: ..."
         )
+        stub_lines.append("    @overload")
+        stub_lines.append(
+            f"    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.{key.name}, {repr(key.value)}], "
+            f"platform: api.Platform | Literal['crossplay', 'steam', 'xbox', 'psn'] | None = None, "
+            f"ignore_cache: bool = False, "
+            f"/, "
+            f"**filters: Any) "
+            f"-> Iterator[models.{value.__name__}]: ..."
+        )
+        stub_lines.append("    @overload")
+        stub_lines.append(
+            f"    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.{key.name}, {repr(key.value)}], "
+            f"platform: api.Platform | Literal['crossplay', 'steam', 'xbox', 'psn'] | None = None, "
+            f"ignore_cache: bool = False, "
+            f"/, "
+            f"**filters: Any) "
+            f"-> AsyncIterator[models.{value.__name__}]: ..."
+        )
         stub_lines.append("")
 
     return "\n".join(stub_lines).replace("'", "\"")
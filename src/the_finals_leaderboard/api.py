@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import functools
 from enum import StrEnum
-from typing import Any, Generic, Type, TypeVar
+from typing import Any, Generic, Sequence, Type, TypeVar
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, PrivateAttr, SerializerFunctionWrapHandler, field_serializer, field_validator
 
-from the_finals_leaderboard import filtering, models
+from the_finals_leaderboard import columnar, diffing, filtering, indexing, models
 
 T = TypeVar("T")
 
@@ -17,43 +17,85 @@ def _to_camel(string: str) -> str:
 
 
 class LeaderboardResult(BaseModel, Generic[T]):
-    leaderboard: Leaderboard
-    platform: Platform | None = None
+    # Read straight from the response's meta, so the body can be validated by pydantic-core without a Python pass.
+    leaderboard: Leaderboard = Field(validation_alias=AliasChoices(AliasPath("meta", "leaderboardVersion"), "leaderboard"))
+    platform: Platform | None = Field(None, validation_alias=AliasChoices(AliasPath("meta", "leaderboardPlatform"), "platform"))
     filters: dict[str, Any] | None = None
 
     players: list[T] = Field(alias="data")
 
+    _indexes: dict[str, indexing.Index] = PrivateAttr(default_factory=dict)
+
     model_config = {
         "alias_generator": _to_camel,
         "populate_by_name": True,
+        "defer_build": True,
     }
 
-    @model_validator(mode="before")
+    @field_validator("leaderboard", "platform", mode="before")
     @classmethod
-    def preprocess(cls, values: dict):
-        meta = values.get("meta", {})
+    def preprocess(cls, value: Any):
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
 
-        mapping = {
-            "leaderboardVersion": "leaderboard",
-            "leaderboardPlatform": "platform",
-        }
+    @field_serializer("players", mode="wrap")
+    def serialize_players(self, players: Sequence[T], handler: SerializerFunctionWrapHandler):
+        if not isinstance(players, list):  # Lazy static results
+            players = list(players)
+        return handler(players)
 
-        for json_key, model_field in mapping.items():
-            if json_key in meta:
-                values[model_field] = meta[json_key]
+    @property
+    def is_lazy(self) -> bool:
+        return isinstance(self.players, columnar.ColumnarLeaderboard)
 
-        for k, v in values.items():
-            if isinstance(v, str) and not v.strip():
-                values[k] = None
+    def filter(self, plan: filtering.FilterPlan | None = None, /, **filters):
+        if plan is None:
+            plan = filtering.compile_filters(**filters)
+        elif filters:
+            plan = filtering.compile_filters(**{**plan.filters, **filters})
 
-        return values
+        players = self.players
+        filtered = plan.apply_indexed(players, self._indexes) if self._indexes else None
+        if filtered is None:
+            if isinstance(players, columnar.ColumnarLeaderboard):
+                filtered = players.filter(plan)
+            else:
+                filtered = plan.apply(players)
 
-    def filter(self, **filters):
-        new = deepcopy(self)
-        new.players = filtering.extended_filter(new.players, **filters)
-        new.filters = filters
+        # Players are frozen, so the new result can share them instead of copying the board.
+        new = self.model_copy(update={"players": filtered, "filters": dict(plan.filters)})
+        new._indexes = {}
         return new
 
+    def create_index(self, field: str, kind: indexing.IndexKind | None = None):
+        user_type = LEADERBOARD_USER_MAP[self.leaderboard]
+        if field not in user_type.model_fields and not hasattr(user_type, field):
+            raise ValueError(f"{user_type.__name__} has no field {field!r}")
+
+        if kind is None:
+            kind = "sorted" if field in indexing.SORTED_FIELDS else "hash"
+
+        if isinstance(self.players, columnar.ColumnarLeaderboard) and self.players.column(field) is not None:
+            values = self.players.column_values(field)
+        else:
+            values = [getattr(player, field) for player in self.players]
+
+        index = indexing.build_index(field, values, kind)
+        # Copies made by the client share the index dict, so replace it rather than mutating it.
+        self._indexes = {**self._indexes, field: index}
+        return self
+
+    @property
+    def indexes(self) -> dict[str, indexing.Index]:
+        return dict(self._indexes)
+
+    def diff(self, newer: LeaderboardResult[T]) -> diffing.LeaderboardDiff[T]:
+        return diffing.diff(self, newer)
+
+    def to_columnar(self) -> columnar.ColumnarLeaderboard[Any]:
+        return columnar.ColumnarLeaderboard.from_result(self)
+
 
 class Leaderboard(StrEnum):
     CB1 = "cb1"
@@ -172,6 +214,12 @@ LEADERBOARD_USER_MAP: dict[Leaderboard, Type[models.BaseUser]] = {
     Leaderboard.S9POINTBREAK: models.Season9PointBreakUser,
 }
 
+
+@functools.cache
+def result_model(leaderboard: Leaderboard) -> Type[LeaderboardResult]:
+    # Parameterizing the generic isn't free, so each leaderboard's model is built once.
+    return LeaderboardResult[LEADERBOARD_USER_MAP[leaderboard]]
+
 LEADERBOARD_PLATFORM_MAP = {
     Leaderboard.CB1: (),
     Leaderboard.CB2: (),
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import gc
 import gzip
+import hashlib
 import json
+import mmap
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
 from importlib import resources
 from pathlib import Path, PurePath
-from typing import Any
+from typing import Any, Callable, Generic, Iterator, MutableMapping, TypeVar, overload
 
-import httpx
-
-from the_finals_leaderboard import api
+from the_finals_leaderboard import api, columnar, indexing
 
 _SCRIPT_DIR = Path(__file__).parent
 _STATIC_PATH = _SCRIPT_DIR / "static"
 _CURRENT_SEASON = "s9"
+_PLAYER_INDEX_FNAME = "player_index.bin"
+_BINARY_SUFFIX = ".col"
+_NAME_KEYS = ("name", "steamName", "xboxName", "psnName")
+
+# Boards mapped once for the whole process, see `share_static`.
+_shared_static: dict[str, columnar.ColumnarLeaderboard] = {}
+_shared_static_lock = threading.Lock()
+
+K = TypeVar("K")
+V = TypeVar("V")
+D = TypeVar("D")
 
 
 def fetch_static():
+    import httpx  # Only needed to rebuild the bundle, kept out of the package's import time
+
     result: dict[str, dict[str, Any]] = {}
 
     with httpx.Client(base_url="https://api.the-finals-leaderboard.com") as client:
@@ -48,13 +69,18 @@ def save_static(data: dict[str, dict[str, Any]]):
         with gzip.open(out_path, "wt", encoding="utf-8") as fp:
             json.dump(value, fp, ensure_ascii=False)
 
+        save_static_binary(f"{key}.json.gz", value)
 
-def load_static(leaderboard: api.Leaderboard, platform: api.Platform | None) -> dict[str, Any]:
+
+def static_fname(leaderboard: api.Leaderboard, platform: api.Platform | None) -> str:
     fname = f"leaderboard_{leaderboard.value}"
     if platform:
-        fname += f"_{platform.value}.json.gz"
+        fname += f"_{platform.value}"
+    return fname + ".json.gz"
 
-    return load_static_fname(fname)
+
+def load_static(leaderboard: api.Leaderboard, platform: api.Platform | None) -> dict[str, Any]:
+    return load_static_fname(static_fname(leaderboard, platform))
 
 
 def load_static_fname(fname: str) -> dict[str, Any]:
@@ -64,14 +90,333 @@ def load_static_fname(fname: str) -> dict[str, Any]:
             return json.load(gz)
 
 
+def load_static_bytes(fname: str) -> bytes:
+    ref = resources.files("the_finals_leaderboard.static").joinpath(fname)
+    with ref.open("rb") as fp:
+        with gzip.open(fp, "rb") as gz:
+            return gz.read()
+
+
+def derived_dir() -> Path:
+    """
+    Where files derived from the bundle (binary boards, the player index) are written, the installed package is
+    never written to. `THE_FINALS_LEADERBOARD_CACHE` overrides the user cache directory, each install gets its own
+    subdirectory.
+    """
+
+    base = os.environ.get("THE_FINALS_LEADERBOARD_CACHE")
+    if base:
+        root = Path(base)
+    elif sys.platform == "win32":
+        root = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local") / "the_finals_leaderboard"
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches" / "the_finals_leaderboard"
+    else:
+        root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "the_finals_leaderboard"
+
+    install = hashlib.blake2b(str(_STATIC_PATH.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return root / install
+
+
+def _write_atomic(path: Path, data: bytes):
+    # A unique temporary file per writer, so processes regenerating the same file at once never rename each
+    # other's partial writes into place.
+    path.parent.mkdir(exist_ok=True, parents=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False) as fp:
+        try:
+            fp.write(data)
+        except BaseException:
+            fp.close()
+            os.unlink(fp.name)
+            raise
+    os.chmod(fp.name, 0o644)  # Temporary files are private to their owner, the cache directory may be shared
+    os.replace(fp.name, path)
+
+
+def _binary_path(fname: str) -> Path:
+    # The gzipped JSON stays the source of truth, the binary file is derived from it.
+    return derived_dir() / (fname.removesuffix(".json.gz") + _BINARY_SUFFIX)
+
+
+def save_static_binary(fname: str, data: dict[str, Any] | None = None) -> Path:
+    if data is None:
+        data = load_static_fname(fname)
+
+    out_path = _binary_path(fname)
+    _write_atomic(out_path, columnar.ColumnarLeaderboard.from_data(data).to_bytes(data.get("meta")))
+    return out_path
+
+
+def compile_static():
+    """
+    Builds the binary file of every static board. They're otherwise built the first time each board is loaded,
+    which makes the first run slower than later ones, so deployments can call this to warm the cache up front.
+    """
+
+    for fname in list_static_fname():
+        save_static_binary(fname)
+
+
+def load_static_binary_fname(fname: str) -> columnar.ColumnarLeaderboard:
+    path = _binary_path(fname)
+    source = _STATIC_PATH / fname
+
+    try:
+        if not path.exists() or (source.exists() and path.stat().st_mtime < source.stat().st_mtime):
+            path = save_static_binary(fname)
+        with open(path, "rb") as fp:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:  # e.g. a cache directory we can't write or read, fall back to decoding the JSON in memory
+        return columnar.ColumnarLeaderboard.from_data(load_static_fname(fname))
+
+    return columnar.ColumnarLeaderboard.from_buffer(buffer)
+
+
+def load_static_binary(leaderboard: api.Leaderboard, platform: api.Platform | None) -> columnar.ColumnarLeaderboard:
+    return load_static_binary_fname(static_fname(leaderboard, platform))
+
+
+def shared_static_binary_fname(fname: str) -> columnar.ColumnarLeaderboard:
+    board = _shared_static.get(fname)
+    if board is None:
+        with _shared_static_lock:
+            board = _shared_static.get(fname)
+            if board is None:
+                board = _shared_static[fname] = load_static_binary_fname(fname)
+    return board
+
+
+def share_static(freeze: bool = True) -> int:
+    """
+    Maps every static board once for the whole process, returning the size of their columns.
+
+    Meant to be called in the parent of a pre-forking server: columns stay in read-only file mappings, so forked
+    workers share their pages instead of each decoding its own copy. With `freeze`, the objects built so far are
+    moved out of the garbage collector's reach (`gc.freeze`), so collections in the workers don't copy their pages.
+    """
+
+    nbytes = sum(shared_static_binary_fname(fname).nbytes for fname in list_static_fname())
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return nbytes
+
+
 def list_static_fname():
     return [
         f.name
         for f in resources.files("the_finals_leaderboard.static").iterdir()
-        if f.name.endswith(".json.gz")
+        if f.name.startswith("leaderboard_") and f.name.endswith(".json.gz")
     ]
 
 
+def static_fingerprint() -> str:
+    """Changes whenever a static file is added, removed or replaced, so files derived from the bundle can be checked."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for fname in sorted(list_static_fname()):
+        path = _STATIC_PATH / fname
+        if path.exists():
+            stat = path.stat()
+            fname = f"{fname}:{stat.st_size}:{stat.st_mtime_ns}"
+        digest.update(fname.encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+def build_player_index() -> indexing.PlayerIndex:
+    def boards():
+        for fname in sorted(list_static_fname()):
+            data = load_static_fname(fname)
+            meta = data.get("meta", {})
+            leaderboard = api.Leaderboard(meta["leaderboardVersion"])
+            platform = api.Platform(meta["leaderboardPlatform"]) if meta.get("leaderboardPlatform") else None
+            yield leaderboard, platform, ([row.get(key) for key in _NAME_KEYS] for row in data["data"])
+
+    return indexing.PlayerIndex.build(boards(), bundle=static_fingerprint())
+
+
+def save_player_index(index: indexing.PlayerIndex):
+    _write_atomic(derived_dir() / _PLAYER_INDEX_FNAME, index.to_bytes())
+
+
+def load_player_index() -> indexing.PlayerIndex:
+    """Raises FileNotFoundError without a saved index and ValueError for one built from other static files."""
+
+    index = indexing.PlayerIndex.from_bytes((derived_dir() / _PLAYER_INDEX_FNAME).read_bytes())
+    if index.bundle != static_fingerprint():
+        raise ValueError("Player index was built from other static files")
+    return index
+
+
+class EvictionPolicy(StrEnum):
+    LRU = "lru"
+    LFU = "lfu"
+
+
+@dataclass(slots=True)
+class CacheStats():
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class BoundedCache(MutableMapping[K, V], Generic[K, V]):
+    """
+    Mapping that evicts entries once it holds more than `max_entries` entries or more than `max_bytes` bytes,
+    as estimated by `sizeof`. A single entry larger than the whole budget is still kept, on its own.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        policy: EvictionPolicy | str = EvictionPolicy.LRU,
+        sizeof: Callable[[V], int] = lambda value: 0,
+        on_evict: Callable[[K, V], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = EvictionPolicy(policy)
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+
+        # Ordered from least to most recently used
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._sizes: dict[K, int] = {}
+        self._uses: dict[K, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return "{0}(policy={1!r}, entries={2}, bytes={3}, max_entries={4!r}, max_bytes={5!r})".format(
+            self.__class__.__name__,
+            self.policy,
+            len(self._data),
+            self._bytes,
+            self.max_entries,
+            self.max_bytes
+        )
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._data))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value = self._data[key]
+            self._data.move_to_end(key)
+            self._uses[key] += 1
+            return value
+
+    def __setitem__(self, key: K, value: V):
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._sizes[key]
+            else:
+                self._uses[key] = 0
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size = self._sizeof(value)
+            self._bytes += size
+            self._uses[key] += 1
+            self._evict(keep=key)
+
+    def __delitem__(self, key: K):
+        with self._lock:
+            del self._data[key]
+            self._bytes -= self._sizes.pop(key)
+            del self._uses[key]
+
+    @overload
+    def get(self, key: K) -> V | None: ...
+
+    @overload
+    def get(self, key: K, default: V) -> V: ...
+
+    @overload
+    def get(self, key: K, default: D) -> V | D: ...
+
+    def get(self, key: K, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                return self[key]
+
+            self._misses += 1
+            return default
+
+    def peek(self, key: K, default: V | None = None) -> V | None:
+        """Like `get`, without counting as a use."""
+
+        return self._data.get(key, default)
+
+    def items_snapshot(self) -> list[tuple[K, V]]:
+        """Copy of the entries, without counting as uses. Iterating the mapping itself would reorder it."""
+
+        with self._lock:
+            return list(self._data.items())
+
+    def fits(self, value: V) -> bool:
+        """Whether `value` could be added without evicting anything."""
+
+        with self._lock:
+            if self.max_entries is not None and len(self._data) >= self.max_entries:
+                return False
+            return self.max_bytes is None or self._bytes + self._sizeof(value) <= self.max_bytes
+
+    def resize(self, key: K):
+        """Re-estimates the size of an entry that changed in place."""
+
+        with self._lock:
+            if key not in self._data:
+                return
+            size = self._sizeof(self._data[key])
+            self._bytes += size - self._sizes[key]
+            self._sizes[key] = size
+            self._evict(keep=key)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self._hits, self._misses, self._evictions, len(self._data), self._bytes)
+
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._data) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _victim(self, keep: K) -> K | None:
+        candidates = (key for key in self._data if key != keep)
+        if self.policy == EvictionPolicy.LFU:
+            # min() keeps the first of equal counts, which is the least recently used one.
+            return min(candidates, key=self._uses.__getitem__, default=None)
+        return next(candidates, None)
+
+    def _evict(self, keep: K):
+        while self._over_budget():
+            key = self._victim(keep)
+            if key is None:
+                return
+
+            value = self._data[key]
+            del self[key]
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+
+
 if __name__ == "__main__":
     a = fetch_static()
     b = save_static(a)
+    save_player_index(build_player_index())
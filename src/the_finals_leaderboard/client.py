@@ -1,23 +1,64 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any, Literal, Mapping
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Literal, Mapping
 
 import httpx
 from pydantic import ValidationError
 
-from the_finals_leaderboard import api, caching
+from the_finals_leaderboard import api, caching, columnar, filtering, indexing, metrics, models
+
+if TYPE_CHECKING:
+    import random
+
+    # Optional backends, only imported once they're used so they don't slow down importing the client.
+    from the_finals_leaderboard import database, history, watching
 
 _MAX_DT = datetime.datetime.max.replace(tzinfo=datetime.timezone.utc)
 
 
 @dataclass(slots=True)
 class _CachedLeaderboard():
-    data: dict[str, Any]
+    data: bytes | columnar.ColumnarLeaderboard | None
     exp_date: datetime.datetime
+    result: api.LeaderboardResult | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)  # Held while validating
+
+
+def _player_bytes(player: models.BaseUser) -> int:
+    values = player.__dict__
+    return sys.getsizeof(player) + sys.getsizeof(values) + sum(
+        sys.getsizeof(value) for value in values.values() if type(value) is str
+    )
+
+
+def _entry_bytes(entry: _CachedLeaderboard) -> int:
+    # Rough estimate, good enough to keep a cache within a memory budget.
+    size = 0
+    if isinstance(entry.data, bytes):
+        size += len(entry.data)
+    elif isinstance(entry.data, columnar.ColumnarLeaderboard):
+        size += entry.data.nbytes
+
+    if entry.result is not None:
+        players = entry.result.players
+        if isinstance(players, columnar.ColumnarLeaderboard):
+            size += players.nbytes
+            players = players.materialized
+        if players:
+            size += len(players) * _player_bytes(next(iter(players)))
+
+    return size
 
 
 class StaticCachingPolicy(StrEnum):
@@ -25,6 +66,7 @@ class StaticCachingPolicy(StrEnum):
     DISK = "disk"
     LAZY = "lazy"
     EAGER = "eager"
+    SHARED = "shared"  # Process-wide mapped boards with lazy results, see `caching.share_static`
 
 
 logger = logging.getLogger(__name__)
@@ -33,43 +75,112 @@ logger = logging.getLogger(__name__)
 class Client():
     def __init__(
         self,
-        static_caching_policy: StaticCachingPolicy | Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER] = StaticCachingPolicy.LAZY,
+        static_caching_policy: StaticCachingPolicy | Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, StaticCachingPolicy.SHARED] = StaticCachingPolicy.LAZY,
         live_caching_ttl: datetime.timedelta | int = datetime.timedelta(minutes=5),
         url: str = "https://api.the-finals-leaderboard.com",
-        timeout: float = 10.0
+        timeout: float = 10.0,
+        indexes: Iterable[str] = (),
+        max_staleness: datetime.timedelta | int = datetime.timedelta(0),
+        lazy_static: bool = False,
+        max_cache_entries: int | None = None,
+        max_cache_bytes: int | None = None,
+        eviction_policy: caching.EvictionPolicy | Literal[caching.EvictionPolicy.LRU, caching.EvictionPolicy.LFU] = caching.EvictionPolicy.LRU,
+        on_evict: Callable[[str, _CachedLeaderboard], None] | None = None,
+        preload: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = (),
+        preload_in_background: bool = False,
+        preload_workers: int = 4,
+        metrics: metrics.MetricsHook | None = None,
+        history: history.HistoryStore | None = None,
+        database: database.LeaderboardDatabase | None = None,
     ):
 
-        self._cache: dict[str, _CachedLeaderboard] = {}
+        self._cache: caching.BoundedCache[str, _CachedLeaderboard] = caching.BoundedCache(
+            max_entries=max_cache_entries,
+            max_bytes=max_cache_bytes,
+            policy=eviction_policy,
+            sizeof=_entry_bytes,
+            on_evict=on_evict,
+        )
 
         self._static_caching_policy = StaticCachingPolicy(static_caching_policy)
-
-        if self._static_caching_policy == StaticCachingPolicy.EAGER:
-            self._preload_all_static()
+        self._indexes = tuple(indexes)
+        self._player_index: indexing.PlayerIndex | None = None
+        self._inflight: dict[str, asyncio.Future[_CachedLeaderboard]] = {}
+        self._lazy_static = lazy_static
+        self._metrics = metrics
+        self._history = history
+        self._database = database
 
         if isinstance(live_caching_ttl, int):
             self._live_caching_ttl = datetime.timedelta(seconds=live_caching_ttl)
         else:
             self._live_caching_ttl = live_caching_ttl
 
-        self._sync_client = httpx.Client(
-            base_url=url,
-            timeout=timeout
-        )
-        self._async_client = httpx.AsyncClient(
-            base_url=url,
-            timeout=timeout
-        )
+        if isinstance(max_staleness, int):
+            self._max_staleness = datetime.timedelta(seconds=max_staleness)
+        else:
+            self._max_staleness = max_staleness
+
+        self._revalidating: set[str] = set()
+        self._revalidating_lock = threading.Lock()
+        self._revalidation_executor: ThreadPoolExecutor | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Created on first use, most callers only ever need one of them.
+        self._url = url
+        self._timeout = timeout
+        self._sync_client_instance: httpx.Client | None = None
+        self._async_client_instance: httpx.AsyncClient | None = None
+        self._transport_lock = threading.Lock()
+
+        priority = Client._parse_requests(preload)
+        self._ready: Future[None]
+        if self._static_caching_policy == StaticCachingPolicy.EAGER and preload_in_background:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="the_finals_leaderboard_preload")
+            self._ready = executor.submit(self._preload_all_static, priority, preload_workers)
+            executor.shutdown(wait=False)
+        else:
+            if self._static_caching_policy == StaticCachingPolicy.EAGER:
+                self._preload_all_static(priority, preload_workers)
+            self._ready = Future()
+            self._ready.set_result(None)
 
-        logger.info(f"Client created {repr(self)}")
+        logger.info("Client created %r", self)
 
     def __repr__(self):
         return "{0}(__static_caching_policy={1!r}, _live_caching_ttl={2!r}, url={3!r})".format(
             self.__class__.__name__,
             self._static_caching_policy,
             self._live_caching_ttl,
-            str(self._sync_client.base_url)
+            self._url
         )
 
+    @property
+    def _sync_client(self) -> httpx.Client:
+        if self._sync_client_instance is None:
+            with self._transport_lock:
+                if self._sync_client_instance is None:
+                    self._sync_client_instance = httpx.Client(
+                        base_url=self._url,
+                        timeout=self._timeout
+                    )
+        return self._sync_client_instance
+
+    @property
+    def _async_client(self) -> httpx.AsyncClient:
+        if self._async_client_instance is None:
+            with self._transport_lock:
+                if self._async_client_instance is None:
+                    self._async_client_instance = httpx.AsyncClient(
+                        base_url=self._url,
+                        timeout=self._timeout
+                    )
+        return self._async_client_instance
+
+    @property
+    def cache_stats(self) -> caching.CacheStats:
+        return self._cache.stats
+
     @staticmethod
     def _cache_key(leaderboard: api.Leaderboard, platform: api.Platform | None):
         return f"leaderboard_{leaderboard.value}{'_'+platform.value if platform else ''}"
@@ -90,76 +201,386 @@ class Client():
             case _:
                 return api.Platform.CROSSPLAY
 
-    def _preload_all_static(self):
-        for fname in caching.list_static_fname():
-            name = fname[:-8]
-            data = caching.load_static_fname(fname)
-            self._cache[name] = _CachedLeaderboard(data, _MAX_DT)
+    def _load_static_entry(self, fname: str) -> _CachedLeaderboard:
+        if self._static_caching_policy == StaticCachingPolicy.SHARED:
+            # Results stay lazy over the process-wide mappings, so a forked worker only holds the rows it reads.
+            board = caching.shared_static_binary_fname(fname)
+        else:
+            board = caching.load_static_binary_fname(fname)
+        if self._lazy_static or self._static_caching_policy == StaticCachingPolicy.SHARED:
+            result = board.to_result(lazy=True)
+            for field in self._indexes:
+                if field in board.user_type.model_fields or hasattr(board.user_type, field):
+                    result.create_index(field)
+            return _CachedLeaderboard(None, _MAX_DT, result=result)
+        return _CachedLeaderboard(board, _MAX_DT)
+
+    def _preload_all_static(
+        self,
+        priority: Iterable[tuple[api.Leaderboard, api.Platform | None]] = (),
+        workers: int = 4,
+    ):
+        fnames = caching.list_static_fname()
+        first = [caching.static_fname(leaderboard, platform) for leaderboard, platform in priority]
+        ordered = list(dict.fromkeys([fname for fname in first if fname in fnames] + fnames))
+
+        def load(fname: str):
+            return fname[:-8], self._load_static_entry(fname)
+
+        # Boards are handed out in order, so the prioritized ones are loaded (and stored) first.
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="the_finals_leaderboard_preload")
+        try:
+            for name, entry in executor.map(load, ordered):
+                if name in self._cache:  # Already loaded by a request in the meantime
+                    continue
+                if not self._cache.fits(entry):
+                    logger.info("Cache is full, stopping preload before %s", name)
+                    break
+                self._cache[name] = entry
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        logger.info("Finished preloading static leaderboards")
+
+    @property
+    def ready(self) -> Future[None]:
+        """Resolves once EAGER preloading is done, immediately unless `preload_in_background` is used."""
+
+        return self._ready
+
+    async def wait_ready_async(self):
+        await asyncio.wrap_future(self._ready)
+
+    def _emit(
+        self,
+        kind: metrics.Phase | metrics.CacheOutcome,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None,
+        start: float | None = None,
+        nbytes: int | None = None,
+        rows: int | None = None,
+    ):
+        hook = self._metrics
+        if hook is None:
+            return
+
+        duration = None if start is None else time.perf_counter()-start
+        try:
+            hook(metrics.MetricEvent(kind, leaderboard, platform, duration, nbytes, rows))
+        except Exception:
+            logger.warning("Metrics hook failed", exc_info=True)
 
     def _get_leaderboard_from_cache(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None) -> _CachedLeaderboard | None:
+        if self._metrics is None:
+            return self._lookup_cache(leaderboard, platform)[0]
+
+        start = time.perf_counter()
+        entry, outcome = self._lookup_cache(leaderboard, platform)
+        self._emit(metrics.Phase.CACHE_LOOKUP, leaderboard, platform, start)
+        self._emit(outcome, leaderboard, platform)
+        return entry
+
+    def _lookup_cache(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+    ) -> tuple[_CachedLeaderboard | None, metrics.CacheOutcome]:
         if self._static_caching_policy == StaticCachingPolicy.DISABLED and not self._live_caching_ttl:
-            logging.info("All forms of caching disabled, returning None")
-            return None
+            logger.info("All forms of caching disabled, returning None")
+            return None, metrics.CacheOutcome.MISS
 
         now = datetime.datetime.now(datetime.timezone.utc)
         cache_key = Client._cache_key(leaderboard, platform)
 
         entry = self._cache.get(cache_key)
+        outcome = metrics.CacheOutcome.HIT
 
-        logging.info(f"Trying to find cached data for {leaderboard.value}")
+        logger.info("Trying to find cached data for %s", leaderboard.value)
 
         if not entry:
-            logging.info(f"Entry for {leaderboard.value} not found in cache")
+            logger.info("Entry for %s not found in cache", leaderboard.value)
             if self._static_caching_policy != StaticCachingPolicy.DISABLED:
+                start = time.perf_counter() if self._metrics is not None else None
                 try:
-                    entry = _CachedLeaderboard(caching.load_static(leaderboard, platform), _MAX_DT)
+                    entry = self._load_static_entry(caching.static_fname(leaderboard, platform))
                 except FileNotFoundError:
-                    logging.info(f"Static file for {leaderboard.value} not found, returning None")
-                    return None
-                if self._static_caching_policy == StaticCachingPolicy.LAZY:
-                    logging.info(f"Lazy caching enabled, saving {leaderboard.value} contents to cache")
+                    logger.info("Static file for %s not found, returning None", leaderboard.value)
+                    return None, metrics.CacheOutcome.MISS
+                if self._metrics is not None:
+                    board = entry.data if entry.result is None else entry.result.players
+                    nbytes = rows = None
+                    if isinstance(board, columnar.ColumnarLeaderboard):
+                        nbytes, rows = board.nbytes, len(board)
+                    self._emit(metrics.Phase.STATIC_LOAD, leaderboard, platform, start, nbytes, rows)
+                if self._static_caching_policy in (StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, StaticCachingPolicy.SHARED):
+                    # With EAGER, this reloads a board that was evicted.
+                    logger.info("Lazy caching enabled, saving %s contents to cache", leaderboard.value)
                     self._cache[cache_key] = entry
+                outcome = metrics.CacheOutcome.STATIC
             else:
-                logging.info(f"Static caching is disabled, returning None")
-                return None
+                logger.info("Static caching is disabled, returning None")
+                return None, metrics.CacheOutcome.MISS
 
         if entry.exp_date > now:
-            logging.info(f"All checks passed, cache for {leaderboard.value} returned")
-            return entry
+            logger.info("All checks passed, cache for %s returned", leaderboard.value)
+            return entry, outcome
+
+        if now - entry.exp_date <= self._max_staleness:
+            logger.info("Cache out of date but within max staleness, returning stale cache for %s", leaderboard.value)
+            return entry, metrics.CacheOutcome.STALE
+
+        logger.info("Cache out of date, skipping for %s", leaderboard.value)
+        return None, metrics.CacheOutcome.MISS
+
+    @staticmethod
+    def _is_stale(entry: _CachedLeaderboard) -> bool:
+        return entry.exp_date <= datetime.datetime.now(datetime.timezone.utc)
+
+    def _revalidate_sync(self, leaderboard: api.Leaderboard, platform: api.Platform | None):
+        cache_key = Client._cache_key(leaderboard, platform)
+        with self._revalidating_lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+            if self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(thread_name_prefix="the_finals_leaderboard_revalidate")
+
+        def revalidate():
+            try:
+                self._get_leaderboard_from_api_sync(leaderboard, platform)
+            except Exception:
+                logger.warning("Background refresh of %s failed", leaderboard.value, exc_info=True)
+            finally:
+                with self._revalidating_lock:
+                    self._revalidating.discard(cache_key)
+
+        logger.info("Refreshing stale cache for %s in the background", leaderboard.value)
+        self._revalidation_executor.submit(revalidate)
+
+    def _revalidate_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None):
+        async def revalidate():
+            try:
+                await self._get_leaderboard_from_api_async(leaderboard, platform)
+            except Exception:
+                logger.warning("Background refresh of %s failed", leaderboard.value, exc_info=True)
+
+        logger.info("Refreshing stale cache for %s in the background", leaderboard.value)
+        task = asyncio.ensure_future(revalidate())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _get_result(self, leaderboard: api.Leaderboard, entry: _CachedLeaderboard) -> api.LeaderboardResult:
+        result = entry.result
+        if result is None:
+            # Readers of the same entry wait for one validation instead of each running (and recording) their own.
+            with entry.lock:
+                result = entry.result
+                if result is None:
+                    result = self._build_result(leaderboard, entry)
+        return result
+
+    def _build_result(self, leaderboard: api.Leaderboard, entry: _CachedLeaderboard) -> api.LeaderboardResult:
+        start = time.perf_counter() if self._metrics is not None else None
+        data = entry.data
+        try:
+            return_type = api.LEADERBOARD_USER_MAP[leaderboard]
+            if isinstance(data, columnar.ColumnarLeaderboard):
+                # Compiled static boards were validated when they were built, so rows skip validation.
+                result = data.to_result()
+            elif data is not None:
+                result = api.result_model(leaderboard).model_validate_json(data)
+            else:
+                raise ValueError(f"Cached entry for {leaderboard.value} has no data")
+        except ValidationError as e:
+            raise ValueError("Unable to validate model. Was bad data returned?") from e
 
-        logging.info(f"Cache out of date, skipping for {leaderboard.value}")
-        return None
+        for field in self._indexes:
+            if field in return_type.model_fields or hasattr(return_type, field):
+                result.create_index(field)
+
+        if self._player_index is not None and entry.exp_date != _MAX_DT:
+            Client._update_player_index(self._player_index, result)
+
+        if self._history is not None and entry.exp_date != _MAX_DT:
+            try:
+                self._history.append(result)
+            except (OSError, ValueError):
+                logger.warning("Unable to record history for %s", leaderboard.value, exc_info=True)
+
+        if self._database is not None and entry.exp_date != _MAX_DT:
+            import sqlite3
+
+            try:
+                self._database.ingest(result)
+            except (sqlite3.Error, ValueError):
+                logger.warning("Unable to store %s in the database", leaderboard.value, exc_info=True)
+
+        if self._metrics is not None:
+            nbytes = len(data) if isinstance(data, bytes) else None
+            self._emit(metrics.Phase.PARSE, leaderboard, result.platform, start, nbytes, len(result.players))
+
+        entry.result = result
+        entry.data = None
+        self._cache.resize(Client._cache_key(leaderboard, result.platform))
+
+        return result
+
+    @staticmethod
+    def _update_player_index(index: indexing.PlayerIndex, result: api.LeaderboardResult):
+        index.update_board(
+            result.leaderboard,
+            result.platform,
+            ([getattr(player, field) for field in indexing.NAME_FIELDS] for player in result.players)
+        )
+
+    def _get_player_index(self) -> indexing.PlayerIndex:
+        if self._player_index is None:
+            try:
+                index = caching.load_player_index()
+            except (FileNotFoundError, ValueError):
+                logger.info("Player index missing or out of date, building it from the static files")
+                index = caching.build_player_index()
+                try:
+                    caching.save_player_index(index)
+                except OSError:
+                    logger.warning("Unable to save the player index to %s", caching.derived_dir(), exc_info=True)
+
+            for _, entry in self._cache.items_snapshot():
+                if entry.result is not None and entry.exp_date != _MAX_DT:
+                    Client._update_player_index(index, entry.result)
+
+            self._player_index = index
+
+        return self._player_index
+
+    def find_player(self, name: str) -> list[indexing.PlayerAppearance]:
+        """
+        Every board a player appears on, by any of their names. The first call loads the index of the static boards
+        from the user cache directory; when it is missing or the static files changed, it is rebuilt from all of
+        them first, which takes several seconds (and is saved for the next process).
+        """
+
+        return self._get_player_index().find(name)
+
+    def _finish_result(self, leaderboard: api.Leaderboard, entry: _CachedLeaderboard, filters: Mapping[str, Any]) -> api.LeaderboardResult:
+        model = self._get_result(leaderboard, entry)
+        if filters:
+            if self._metrics is None:
+                return model.filter(**filters)
+            start = time.perf_counter()
+            filtered = model.filter(**filters)
+            self._emit(metrics.Phase.FILTER, leaderboard, model.platform, start, rows=len(filtered.players))
+            return filtered
+        if model.is_lazy:
+            # Views over the same columns share decoded rows, nothing to copy.
+            return model.model_copy(update={"players": model.players[:]})
+        return model.model_copy(update={"players": list(model.players)})
+
+    @staticmethod
+    def _parse_requests(leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]]):
+        parsed: list[tuple[api.Leaderboard, api.Platform | None]] = []
+        for request in leaderboards:
+            if isinstance(request, str):
+                leaderboard, platform = request, None
+            else:
+                leaderboard, platform = request
+            leaderboard = api.Leaderboard(leaderboard)
+            parsed.append((leaderboard, Client._parse_platform(leaderboard, platform)))
+        return parsed
+
+    def _revalidation_headers(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> tuple[_CachedLeaderboard | None, dict[str, str]]:
+        previous = self._cache.peek(Client._cache_key(leaderboard, platform))
+        headers: dict[str, str] = {}
+
+        if previous is not None and previous.exp_date != _MAX_DT:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        return previous, headers
+
+    def _not_modified(self, leaderboard: api.Leaderboard, platform: api.Platform | None, previous: _CachedLeaderboard, now: datetime.datetime):
+        logger.info("Leaderboard data for %s not modified, extending cache expiry", leaderboard.value)
+        if self._metrics is not None:
+            self._emit(metrics.CacheOutcome.NOT_MODIFIED, leaderboard, platform)
+        previous.exp_date = now+self._live_caching_ttl
+        return previous
 
     def _get_leaderboard_from_api_sync(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None):
         now = datetime.datetime.now(datetime.timezone.utc)
         url = Client._api_path(leaderboard, platform)
-
-        resp = self._sync_client.get(url)
+        previous, headers = self._revalidation_headers(leaderboard, platform)
+
+        start = time.perf_counter() if self._metrics is not None else None
+        resp = self._sync_client.get(url, headers=headers)
+        if self._metrics is not None:
+            self._emit(metrics.Phase.FETCH, leaderboard, platform, start, len(resp.content))
+        if previous is not None and resp.status_code == httpx.codes.NOT_MODIFIED:
+            return self._not_modified(leaderboard, platform, previous, now)
         resp.raise_for_status()
 
-        logging.info(f"Fetched leaderboard data for {leaderboard.value} from API")
+        logger.info("Fetched leaderboard data for %s from API", leaderboard.value)
 
-        data = _CachedLeaderboard(resp.json(), now+self._live_caching_ttl)
+        data = _CachedLeaderboard(
+            resp.content,
+            now+self._live_caching_ttl,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        # Validated before it's cached, so readers never find (and validate) the raw payload themselves.
+        self._get_result(leaderboard, data)
 
         if self._live_caching_ttl.total_seconds() > 0:
-            logging.info(f"Storing fetched data for {leaderboard.value} in cache")
+            logger.info("Storing fetched data for %s in cache", leaderboard.value)
             self._cache[Client._cache_key(leaderboard, platform)] = data
 
         return data
 
     async def _get_leaderboard_from_api_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None):
+        # Concurrent misses for the same board share one request (and one validation).
+        cache_key = Client._cache_key(leaderboard, platform)
+        flight = self._inflight.get(cache_key)
+
+        if flight is None or flight.done() or flight.get_loop() is not asyncio.get_running_loop():
+            flight = asyncio.ensure_future(self._fetch_leaderboard_async(leaderboard, platform))
+            self._inflight[cache_key] = flight
+
+            def _land(done: asyncio.Future):
+                if self._inflight.get(cache_key) is done:
+                    del self._inflight[cache_key]
+
+            flight.add_done_callback(_land)
+        else:
+            logger.info("Joining in-flight request for %s", leaderboard.value)
+
+        return await asyncio.shield(flight)
+
+    async def _fetch_leaderboard_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None):
         now = datetime.datetime.now(datetime.timezone.utc)
         url = Client._api_path(leaderboard, platform)
-
-        resp = await self._async_client.get(url)
+        previous, headers = self._revalidation_headers(leaderboard, platform)
+
+        start = time.perf_counter() if self._metrics is not None else None
+        resp = await self._async_client.get(url, headers=headers)
+        if self._metrics is not None:
+            self._emit(metrics.Phase.FETCH, leaderboard, platform, start, len(resp.content))
+        if previous is not None and resp.status_code == httpx.codes.NOT_MODIFIED:
+            return self._not_modified(leaderboard, platform, previous, now)
         resp.raise_for_status()
 
-        logging.info(f"Fetched leaderboard data for {leaderboard.value} from API")
+        logger.info("Fetched leaderboard data for %s from API", leaderboard.value)
 
-        data = _CachedLeaderboard(resp.json(), now+self._live_caching_ttl)
+        data = _CachedLeaderboard(
+            resp.content,
+            now+self._live_caching_ttl,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        await asyncio.to_thread(self._get_result, leaderboard, data)
 
         if self._live_caching_ttl.total_seconds() > 0:
-            logging.info(f"Storing fetched data for {leaderboard.value} in cache")
+            logger.info("Storing fetched data for %s in cache", leaderboard.value)
             self._cache[Client._cache_key(leaderboard, platform)] = data
 
         return data
@@ -180,15 +601,10 @@ class Client():
             data = self._get_leaderboard_from_cache(leaderboard, platform)
         if not data:
             data = self._get_leaderboard_from_api_sync(leaderboard, platform)
+        elif Client._is_stale(data):
+            self._revalidate_sync(leaderboard, platform)
 
-        try:
-            return_type = api.LEADERBOARD_USER_MAP[leaderboard]
-            model = api.LeaderboardResult[return_type].model_validate(data.data)
-            if filters:
-                model = model.filter(**filters)
-            return model
-        except ValidationError as e:
-            raise ValueError("Unable to validate model. Was bad data returned?") from e
+        return self._finish_result(leaderboard, data, filters)
 
     async def get_leaderboard_async(
         self,
@@ -206,12 +622,189 @@ class Client():
             data = self._get_leaderboard_from_cache(leaderboard, platform)
         if not data:
             data = await self._get_leaderboard_from_api_async(leaderboard, platform)
+        elif Client._is_stale(data):
+            self._revalidate_async(leaderboard, platform)
+
+        return self._finish_result(leaderboard, data, filters)
 
+    async def _poll_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> api.LeaderboardResult:
+        """Fetches a board past the cache. As long as the server doesn't change it, the same result object is returned."""
+
+        entry = await self._get_leaderboard_from_api_async(leaderboard, platform)
+        if entry.result is None:
+            return await asyncio.to_thread(self._get_result, leaderboard, entry)
+        return entry.result
+
+    def watch(
+        self,
+        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = api.CURRENT_SEASON_LEADERBOARDS,
+        /,
+        *,
+        interval: datetime.timedelta | int | None = None,
+        jitter: float = 0.1,
+        max_interval: datetime.timedelta | int | None = None,
+        backoff: float = 2.0,
+        max_requests: int | None = None,
+        budget_period: datetime.timedelta | int = datetime.timedelta(minutes=1),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> watching.Watcher:
+        """
+        Polls the boards (the current season by default) every `interval`, the live cache TTL unless given, and
+        pushes change events to the watcher's subscribers. Start it with `async with client.watch() as watcher:`.
+        """
+
+        def seconds(value: datetime.timedelta | int) -> float:
+            if isinstance(value, datetime.timedelta):
+                return value.total_seconds()
+            return float(value)
+
+        from the_finals_leaderboard import watching
+
+        budget = None
+        if max_requests is not None:
+            budget = watching.RequestBudget(max_requests, seconds(budget_period), clock, sleep)
+
+        return watching.Watcher(
+            self,
+            Client._parse_requests(leaderboards),
+            interval=seconds(interval) if interval is not None else self._live_caching_ttl.total_seconds() or 300.0,
+            jitter=jitter,
+            max_interval=seconds(max_interval) if max_interval is not None else None,
+            backoff=backoff,
+            budget=budget,
+            clock=clock,
+            sleep=sleep,
+            rng=rng,
+        )
+
+    @staticmethod
+    def _stream_players(leaderboard: api.Leaderboard, rows: Iterable[dict[str, Any]], plan: filtering.FilterPlan) -> Iterator[models.BaseUser]:
+        user_type = api.LEADERBOARD_USER_MAP[leaderboard]
+        for row in rows:
+            try:
+                player = user_type.model_validate(row)
+            except ValidationError as e:
+                raise ValueError("Unable to validate model. Was bad data returned?") from e
+            if plan(player):
+                yield player
+
+    def iter_leaderboard_sync(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+        ignore_cache: bool = False,
+        /,
+        **filters: Any,
+    ) -> Iterator[models.BaseUser]:
+        """Yields players as they are parsed from the response. Boards fetched this way are not cached."""
+
+        leaderboard = api.Leaderboard(leaderboard)
+        platform = Client._parse_platform(leaderboard, platform)
+
+        if not ignore_cache:
+            data = self._get_leaderboard_from_cache(leaderboard, platform)
+            if data:
+                if Client._is_stale(data):
+                    self._revalidate_sync(leaderboard, platform)
+                yield from self._finish_result(leaderboard, data, filters).players
+                return
+
+        from the_finals_leaderboard import streaming
+
+        plan = filtering.compile_filters(**filters)
+        with self._sync_client.stream("GET", Client._api_path(leaderboard, platform)) as resp:
+            resp.raise_for_status()
+            logger.info("Streaming leaderboard data for %s from API", leaderboard.value)
+            yield from Client._stream_players(leaderboard, streaming.iter_rows(resp.iter_bytes()), plan)
+
+    async def aiter_leaderboard_async(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+        ignore_cache: bool = False,
+        /,
+        **filters: Any,
+    ) -> AsyncIterator[models.BaseUser]:
+        """Yields players as they are parsed from the response. Boards fetched this way are not cached."""
+
+        leaderboard = api.Leaderboard(leaderboard)
+        platform = Client._parse_platform(leaderboard, platform)
+
+        if not ignore_cache:
+            data = self._get_leaderboard_from_cache(leaderboard, platform)
+            if data:
+                if Client._is_stale(data):
+                    self._revalidate_async(leaderboard, platform)
+                for player in self._finish_result(leaderboard, data, filters).players:
+                    yield player
+                return
+
+        from the_finals_leaderboard import streaming
+
+        plan = filtering.compile_filters(**filters)
+        parser = streaming.LeaderboardParser()
+        async with self._async_client.stream("GET", Client._api_path(leaderboard, platform)) as resp:
+            resp.raise_for_status()
+            logger.info("Streaming leaderboard data for %s from API", leaderboard.value)
+            async for chunk in resp.aiter_bytes():
+                for player in Client._stream_players(leaderboard, parser.feed(chunk), plan):
+                    yield player
+            for player in Client._stream_players(leaderboard, parser.close(), plan):
+                yield player
+
+    def get_leaderboards_sync(
+        self,
+        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]],
+        ignore_cache: bool = False,
+        /,
+        *,
+        max_workers: int = 8,
+        **filters: Any,
+    ) -> Iterator[api.LeaderboardResult]:
+        requests = Client._parse_requests(leaderboards)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="the_finals_leaderboard")
         try:
-            return_type = api.LEADERBOARD_USER_MAP[leaderboard]
-            model = api.LeaderboardResult[return_type].model_validate(data.data)
-            if filters:
-                model = model.filter(**filters)
-            return model
-        except ValidationError as e:
-            raise ValueError("Unable to validate model. Was bad data returned?") from e
+            futures = [
+                executor.submit(self.get_leaderboard_sync, leaderboard, platform, ignore_cache, **filters)
+                for leaderboard, platform in requests
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def get_leaderboards_async(
+        self,
+        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]],
+        ignore_cache: bool = False,
+        /,
+        *,
+        concurrency: int = 8,
+        **filters: Any,
+    ) -> AsyncIterator[api.LeaderboardResult]:
+        requests = Client._parse_requests(leaderboards)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(leaderboard: api.Leaderboard, platform: api.Platform | None):
+            async with semaphore:
+                data = None
+                if not ignore_cache:
+                    # Might have to read a static file from the disk
+                    data = await asyncio.to_thread(self._get_leaderboard_from_cache, leaderboard, platform)
+                if not data:
+                    data = await self._get_leaderboard_from_api_async(leaderboard, platform)
+                elif Client._is_stale(data):
+                    self._revalidate_async(leaderboard, platform)
+
+            return await asyncio.to_thread(self._finish_result, leaderboard, data, filters)
+
+        tasks = [asyncio.ensure_future(fetch(leaderboard, platform)) for leaderboard, platform in requests]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import datetime
+from concurrent.futures import Future
 from enum import StrEnum
-from typing import Any, Literal, overload
+import random
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Literal, overload
 
-from the_finals_leaderboard import api, models
+from the_finals_leaderboard import api, caching, database, history, indexing, metrics, models, watching
 
 
 class StaticCachingPolicy(StrEnum):
@@ -12,275 +14,526 @@ class StaticCachingPolicy(StrEnum):
     DISK = "disk"
     LAZY = "lazy"
     EAGER = "eager"
+    SHARED = "shared"
 
 
 class Client():
     def __init__(
         self,
-        static_caching_policy: Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, "disabled", "disk", "lazy", "eager"] = StaticCachingPolicy.LAZY,
+        static_caching_policy: Literal[StaticCachingPolicy.DISABLED, StaticCachingPolicy.DISK, StaticCachingPolicy.LAZY, StaticCachingPolicy.EAGER, StaticCachingPolicy.SHARED, "disabled", "disk", "lazy", "eager", "shared"] = StaticCachingPolicy.LAZY,
         live_caching_ttl: datetime.timedelta | int = datetime.timedelta(minutes=5),
         url: str = "https://api.the-finals-leaderboard.com",
-        timeout: float = 10.0
+        timeout: float = 10.0,
+        indexes: Iterable[str] = (),
+        max_staleness: datetime.timedelta | int = datetime.timedelta(0),
+        lazy_static: bool = False,
+        max_cache_entries: int | None = None,
+        max_cache_bytes: int | None = None,
+        eviction_policy: Literal[caching.EvictionPolicy.LRU, caching.EvictionPolicy.LFU, "lru", "lfu"] = caching.EvictionPolicy.LRU,
+        on_evict: Callable[[str, Any], None] | None = None,
+        preload: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = (),
+        preload_in_background: bool = False,
+        preload_workers: int = 4,
+        metrics: metrics.MetricsHook | None = None,
+        history: history.HistoryStore | None = None,
+        database: database.LeaderboardDatabase | None = None,
     ): ...
 
+    @property
+    def ready(self) -> Future[None]: ...
+    async def wait_ready_async(self) -> None: ...
+
+    @property
+    def cache_stats(self) -> caching.CacheStats: ...
+
+    def find_player(self, name: str) -> list[indexing.PlayerAppearance]: ...
+
+    def watch(
+        self,
+        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] = api.CURRENT_SEASON_LEADERBOARDS,
+        /,
+        *,
+        interval: datetime.timedelta | int | None = None,
+        jitter: float = 0.1,
+        max_interval: datetime.timedelta | int | None = None,
+        backoff: float = 2.0,
+        max_requests: int | None = None,
+        budget_period: datetime.timedelta | int = datetime.timedelta(minutes=1),
+        clock: Callable[[], float] = ...,
+        sleep: Callable[[float], Awaitable[Any]] = ...,
+        rng: random.Random | None = None,
+    ) -> watching.Watcher: ...
+    async def _poll_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> api.LeaderboardResult[Any]: ...
+
+    def get_leaderboards_sync(self, leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]], ignore_cache: bool = False, /, *, max_workers: int = 8, **filters: Any) -> Iterator[api.LeaderboardResult[Any]]: ...
+    def get_leaderboards_async(self, leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]], ignore_cache: bool = False, /, *, concurrency: int = 8, **filters: Any) -> AsyncIterator[api.LeaderboardResult[Any]]: ...
+
     # The pit of overloads
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.CB1, "cb1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.CB1RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.CB1, "cb1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.CB1RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.CB1, "cb1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.CB1RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.CB1, "cb1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.CB1RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.CB2, "cb2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.CB2RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.CB2, "cb2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.CB2RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.CB2, "cb2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.CB2RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.CB2, "cb2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.CB2RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.OB, "ob"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.OBRankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.OB, "ob"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.OBRankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.OB, "ob"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.OBRankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.OB, "ob"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.OBRankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S1, "s1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season1RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S1, "s1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season1RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S1, "s1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season1RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S1, "s1"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season1RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S2, "s2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season2RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S2, "s2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season2RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S2, "s2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season2RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S2, "s2"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season2RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3, "s3"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3, "s3"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3, "s3"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season3RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3, "s3"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season3RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3ORIGINAL, "s3original"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3ORIGINAL, "s3original"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3ORIGINAL, "s3original"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season3RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3ORIGINAL, "s3original"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season3RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3WORLDTOUR, "s3worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3WORLDTOUR, "s3worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season3WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S3WORLDTOUR, "s3worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season3WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S3WORLDTOUR, "s3worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season3WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4, "s4"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4, "s4"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4, "s4"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season4RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4, "s4"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season4RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4WORLDTOUR, "s4worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4WORLDTOUR, "s4worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4WORLDTOUR, "s4worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season4WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4WORLDTOUR, "s4worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season4WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4SPONSOR, "s4sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4SPONSOR, "s4sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season4SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S4SPONSOR, "s4sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season4SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S4SPONSOR, "s4sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season4SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5, "s5"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5, "s5"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5, "s5"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5, "s5"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5SPONSOR, "s5sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5SPONSOR, "s5sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5SPONSOR, "s5sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5SPONSOR, "s5sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5WORLDTOUR, "s5worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5WORLDTOUR, "s5worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5WORLDTOUR, "s5worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5WORLDTOUR, "s5worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5TERMINALATTACK, "s5terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5TerminalAttackUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5TERMINALATTACK, "s5terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5TerminalAttackUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5TERMINALATTACK, "s5terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5TerminalAttackUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5TERMINALATTACK, "s5terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5TerminalAttackUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5POWERSHIFT, "s5powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5PowerShiftUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5POWERSHIFT, "s5powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5PowerShiftUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5POWERSHIFT, "s5powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5PowerShiftUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5POWERSHIFT, "s5powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5PowerShiftUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5QUICKCASH, "s5quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5QuickCashUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5QUICKCASH, "s5quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5QuickCashUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5QUICKCASH, "s5quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5QuickCashUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5QUICKCASH, "s5quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5QuickCashUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5BANKIT, "s5bankit"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5BankItUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5BANKIT, "s5bankit"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season5BankItUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S5BANKIT, "s5bankit"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season5BankItUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S5BANKIT, "s5bankit"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season5BankItUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6, "s6"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6, "s6"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6, "s6"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6, "s6"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6SPONSOR, "s6sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6SPONSOR, "s6sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6SPONSOR, "s6sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6SPONSOR, "s6sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6WORLDTOUR, "s6worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6WORLDTOUR, "s6worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6WORLDTOUR, "s6worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6WORLDTOUR, "s6worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6TERMINALATTACK, "s6terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6TerminalAttackUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6TERMINALATTACK, "s6terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6TerminalAttackUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6TERMINALATTACK, "s6terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6TerminalAttackUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6TERMINALATTACK, "s6terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6TerminalAttackUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6POWERSHIFT, "s6powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6PowerShiftUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6POWERSHIFT, "s6powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6PowerShiftUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6POWERSHIFT, "s6powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6PowerShiftUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6POWERSHIFT, "s6powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6PowerShiftUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6QUICKCASH, "s6quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6QuickCashUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6QUICKCASH, "s6quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6QuickCashUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6QUICKCASH, "s6quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6QuickCashUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6QUICKCASH, "s6quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6QuickCashUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6TEAMDEATHMATCH, "s6teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6TeamDeathmatchUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6TEAMDEATHMATCH, "s6teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6TeamDeathmatchUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6TEAMDEATHMATCH, "s6teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6TeamDeathmatchUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6TEAMDEATHMATCH, "s6teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6TeamDeathmatchUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6HEAVYHITTERS, "s6heavyhitters"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6HeavyHittersUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6HEAVYHITTERS, "s6heavyhitters"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season6HeavyHittersUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S6HEAVYHITTERS, "s6heavyhitters"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season6HeavyHittersUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S6HEAVYHITTERS, "s6heavyhitters"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season6HeavyHittersUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7, "s7"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7, "s7"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7, "s7"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7, "s7"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7SPONSOR, "s7sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7SPONSOR, "s7sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7SPONSOR, "s7sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7SPONSOR, "s7sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7WORLDTOUR, "s7worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7WORLDTOUR, "s7worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7WORLDTOUR, "s7worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7WORLDTOUR, "s7worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7TERMINALATTACK, "s7terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7TerminalAttackUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7TERMINALATTACK, "s7terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7TerminalAttackUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7TERMINALATTACK, "s7terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7TerminalAttackUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7TERMINALATTACK, "s7terminalattack"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7TerminalAttackUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7POWERSHIFT, "s7powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7PowerShiftUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7POWERSHIFT, "s7powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7PowerShiftUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7POWERSHIFT, "s7powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7PowerShiftUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7POWERSHIFT, "s7powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7PowerShiftUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7QUICKCASH, "s7quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7QuickCashUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7QUICKCASH, "s7quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7QuickCashUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7QUICKCASH, "s7quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7QuickCashUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7QUICKCASH, "s7quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7QuickCashUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7TEAMDEATHMATCH, "s7teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7TeamDeathmatchUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7TEAMDEATHMATCH, "s7teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7TeamDeathmatchUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7TEAMDEATHMATCH, "s7teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7TeamDeathmatchUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7TEAMDEATHMATCH, "s7teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7TeamDeathmatchUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7BLASTOFF, "s7blastoff"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7BlastOffUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7BLASTOFF, "s7blastoff"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7BlastOffUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7BLASTOFF, "s7blastoff"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7BlastOffUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7BLASTOFF, "s7blastoff"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7BlastOffUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7CASHBALL, "s7cashball"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7CashBallUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7CASHBALL, "s7cashball"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season7CashBallUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S7CASHBALL, "s7cashball"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season7CashBallUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S7CASHBALL, "s7cashball"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season7CashBallUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8, "s8"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8, "s8"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8, "s8"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8, "s8"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8SPONSOR, "s8sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8SPONSOR, "s8sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8SPONSOR, "s8sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8SPONSOR, "s8sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8WORLDTOUR, "s8worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8WORLDTOUR, "s8worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8WORLDTOUR, "s8worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8WORLDTOUR, "s8worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8HEAD2HEAD, "s8head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8Head2HeadUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8HEAD2HEAD, "s8head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8Head2HeadUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8HEAD2HEAD, "s8head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8Head2HeadUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8HEAD2HEAD, "s8head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8Head2HeadUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8POWERSHIFT, "s8powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8PowerShiftUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8POWERSHIFT, "s8powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8PowerShiftUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8POWERSHIFT, "s8powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8PowerShiftUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8POWERSHIFT, "s8powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8PowerShiftUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8QUICKCASH, "s8quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8QuickCashUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8QUICKCASH, "s8quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8QuickCashUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8QUICKCASH, "s8quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8QuickCashUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8QUICKCASH, "s8quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8QuickCashUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8TEAMDEATHMATCH, "s8teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8TeamDeathmatchUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8TEAMDEATHMATCH, "s8teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8TeamDeathmatchUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8TEAMDEATHMATCH, "s8teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8TeamDeathmatchUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8TEAMDEATHMATCH, "s8teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8TeamDeathmatchUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8HEAVENORELSE, "s8heavenorelse"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8HeavenOrElseUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8HEAVENORELSE, "s8heavenorelse"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8HeavenOrElseUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8HEAVENORELSE, "s8heavenorelse"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8HeavenOrElseUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8HEAVENORELSE, "s8heavenorelse"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8HeavenOrElseUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8GHOULRUSH, "s8ghoulrush"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8GhoulRushUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8GHOULRUSH, "s8ghoulrush"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season8GhoulRushUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S8GHOULRUSH, "s8ghoulrush"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season8GhoulRushUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S8GHOULRUSH, "s8ghoulrush"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season8GhoulRushUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9, "s9"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9RankedUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9, "s9"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9RankedUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9, "s9"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9RankedUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9, "s9"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9RankedUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9SPONSOR, "s9sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9SponsorUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9SPONSOR, "s9sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9SponsorUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9SPONSOR, "s9sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9SponsorUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9SPONSOR, "s9sponsor"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9SponsorUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9WORLDTOUR, "s9worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9WorldTourUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9WORLDTOUR, "s9worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9WorldTourUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9WORLDTOUR, "s9worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9WorldTourUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9WORLDTOUR, "s9worldtour"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9WorldTourUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9HEAD2HEAD, "s9head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9Head2HeadUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9HEAD2HEAD, "s9head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9Head2HeadUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9HEAD2HEAD, "s9head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9Head2HeadUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9HEAD2HEAD, "s9head2head"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9Head2HeadUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9POWERSHIFT, "s9powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9PowerShiftUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9POWERSHIFT, "s9powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9PowerShiftUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9POWERSHIFT, "s9powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9PowerShiftUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9POWERSHIFT, "s9powershift"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9PowerShiftUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9QUICKCASH, "s9quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9QuickCashUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9QUICKCASH, "s9quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9QuickCashUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9QUICKCASH, "s9quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9QuickCashUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9QUICKCASH, "s9quickcash"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9QuickCashUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9TEAMDEATHMATCH, "s9teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9TeamDeathmatchUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9TEAMDEATHMATCH, "s9teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9TeamDeathmatchUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9TEAMDEATHMATCH, "s9teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9TeamDeathmatchUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9TEAMDEATHMATCH, "s9teamdeathmatch"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9TeamDeathmatchUser]: ...
 
     @overload
     def get_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9POINTBREAK, "s9pointbreak"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9PointBreakUser]: ...
     @overload
     async def get_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9POINTBREAK, "s9pointbreak"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> api.LeaderboardResult[models.Season9PointBreakUser]: ...
+    @overload
+    def iter_leaderboard_sync(self, leaderboard: Literal[api.Leaderboard.S9POINTBREAK, "s9pointbreak"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> Iterator[models.Season9PointBreakUser]: ...
+    @overload
+    def aiter_leaderboard_async(self, leaderboard: Literal[api.Leaderboard.S9POINTBREAK, "s9pointbreak"], platform: api.Platform | Literal["crossplay", "steam", "xbox", "psn"] | None = None, ignore_cache: bool = False, /, **filters: Any) -> AsyncIterator[models.Season9PointBreakUser]: ...
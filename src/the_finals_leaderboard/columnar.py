@@ -0,0 +1,597 @@
+from __future__ import annotations
+
+import functools
+import json
+import struct
+import sys
+from array import array
+from enum import Enum, IntEnum
+from typing import Any, Callable, Collection, Iterable, Iterator, Literal, Sequence, Type, TypeAlias, TypeVar, overload
+
+from pydantic import ValidationError
+
+from the_finals_leaderboard import api, filtering, models
+
+T = TypeVar("T", bound=models.BaseUser)
+
+# Fields backing the `score` property, in order of precedence (CB1 has both fame and cashouts).
+SCORE_FIELDS = ("rank_score", "points", "fans", "fame", "cashouts")
+
+_INT_COMPARISONS = frozenset(("exact", "gt", "gte", "lt", "lte"))
+
+BINARY_MAGIC = b"TFLCOL1\0"
+_BINARY_ALIGN = 8
+_INT32_MIN, _INT32_MAX = -(1 << 31), (1 << 31) - 1
+_MATERIALIZE_CHUNK = 256
+# Below one row per this many strings, rows are decoded without decoding the rest of the string table.
+_PARTIAL_DECODE_RATIO = 4
+
+# Integers are kept in an array when built in memory, or in a view of the binary bundle when mapped from it.
+IntStorage: TypeAlias = "array[int] | memoryview"
+IntTypecode = Literal["b", "B", "h", "H", "i", "I", "l", "L", "q", "Q"]
+
+
+class IntColumn():
+    __slots__ = ("values",)
+
+    def __init__(self, values: IntStorage):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.values) * self.values.itemsize
+
+    def __getitem__(self, i: int) -> int:
+        return self.values[i]
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]):
+        return cls(array("q", (int(v) for v in values)))
+
+    def select(self, predicate: filtering.Predicate, selection: Iterable[int]) -> list[int]:
+        values = self.values
+        target = predicate.target
+        if predicate.op_name in _INT_COMPARISONS and isinstance(target, (int, float)) and not isinstance(target, bool):
+            match predicate.op_name:
+                case "exact":
+                    return [i for i in selection if values[i] == target]
+                case "gt":
+                    return [i for i in selection if values[i] > target]
+                case "gte":
+                    return [i for i in selection if values[i] >= target]
+                case "lt":
+                    return [i for i in selection if values[i] < target]
+                case "lte":
+                    return [i for i in selection if values[i] <= target]
+
+        test = predicate.test
+        return [i for i in selection if test(values[i])]
+
+
+class StringColumn():
+    """Dictionary-encoded column, code 0 is always None."""
+
+    __slots__ = ("codes", "table")
+
+    def __init__(self, codes: IntStorage, table: Sequence[str | None]):
+        self.codes = codes
+        self.table = table
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        if isinstance(self.table, BinaryStringTable):
+            table_bytes = self.table.nbytes
+        else:
+            table_bytes = sum(sys.getsizeof(value) for value in self.table)
+        return len(self.codes) * self.codes.itemsize + table_bytes
+
+    def __getitem__(self, i: int) -> str | None:
+        return self.table[self.codes[i]]
+
+    def decoded_table(self) -> Sequence[str | None]:
+        if isinstance(self.table, BinaryStringTable):
+            return self.table.decoded()
+        return self.table
+
+    def decoded_for(self, rows: Sequence[int], reading: int) -> Sequence[str | None] | dict[int, str | None]:
+        """
+        Lookup from code to value covering `rows`, out of `reading` rows about to be read. Only their strings are
+        decoded when that's few compared to the table.
+        """
+
+        table = self.table
+        if isinstance(table, BinaryStringTable) and not table.is_decoded and reading * _PARTIAL_DECODE_RATIO < len(table):
+            codes = self.codes
+            return {code: table[code] for code in {codes[row] for row in rows}}
+        return self.decoded_table()
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]):
+        lookup: dict[str | None, int] = {None: 0}
+        table: list[str | None] = [None]
+        codes = array("I")
+
+        for value in values:
+            if isinstance(value, Enum):
+                value = value.value
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(table)
+                table.append(value)
+            codes.append(code)
+
+        return cls(codes, table)
+
+    def select(self, predicate: filtering.Predicate, selection: Iterable[int]) -> list[int]:
+        # Each distinct value is only tested once.
+        accepted = bytes(predicate.test(value) for value in self.table)
+        codes = self.codes
+        return [i for i in selection if accepted[codes[i]]]
+
+
+class BinaryStringTable(Sequence[str | None]):
+    """String table of a binary bundle, strings are only decoded when accessed."""
+
+    __slots__ = ("_offsets", "_blob", "_decoded")
+
+    def __init__(self, offsets: IntStorage, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+        self._decoded: list[str | None] | None = None
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._decoded is not None
+
+    @property
+    def nbytes(self) -> int:
+        size = len(self._offsets) * self._offsets.itemsize + self._blob.nbytes
+        if self._decoded is not None:
+            size += sum(sys.getsizeof(value) for value in self._decoded)
+        return size
+
+    @overload
+    def __getitem__(self, code: int) -> str | None: ...
+
+    @overload
+    def __getitem__(self, code: slice) -> list[str | None]: ...
+
+    def __getitem__(self, code: int | slice) -> str | None | list[str | None]:
+        if isinstance(code, slice):
+            return self.decoded()[code]
+        if self._decoded is not None:
+            return self._decoded[code]
+        if code == 0:
+            return None
+        return str(self._blob[self._offsets[code]:self._offsets[code + 1]], "utf-8")
+
+    def __iter__(self):
+        return iter(self.decoded())
+
+    def decoded(self) -> list[str | None]:
+        if self._decoded is None:
+            offsets, blob = self._offsets, self._blob
+            decoded: list[str | None] = [None]
+            decoded.extend(str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in range(1, len(offsets) - 1))
+            self._decoded = decoded
+        return self._decoded
+
+
+Column = IntColumn | StringColumn
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _cast(buffer: memoryview, offset: int, typecode: IntTypecode, count: int) -> IntStorage:
+    size = array(typecode).itemsize
+    view = buffer[offset:offset + count * size]
+    if sys.byteorder != "little":
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+    return view.cast(typecode)
+
+
+def _is_int_field(annotation: Any) -> bool:
+    return annotation is int or (isinstance(annotation, type) and issubclass(annotation, IntEnum))
+
+
+def _empty_to_none(value: Any) -> Any:
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def _enum_converter(enum_type: Type[Enum]) -> Callable[[Any], Enum]:
+    members = enum_type._value2member_map_
+
+    def convert(value: Any) -> Enum:
+        member = members.get(value)
+        if member is None:
+            return enum_type(value)  # Raises for unknown values
+        return member
+
+    return convert
+
+
+@functools.cache
+def _converters(user_type: Type[models.BaseUser]) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    # Column values are already plain ints, strings and None, only enums need converting.
+    return tuple(
+        (name, _enum_converter(field.annotation))
+        for name, field in user_type.model_fields.items()
+        if isinstance(field.annotation, type) and issubclass(field.annotation, Enum)
+    )
+
+
+def construct_trusted(user_type: Type[T], values: dict[str, Any]) -> T:
+    """
+    Builds a player from already normalized values without validating them, the same way `model_construct` does
+    but without its per-field overhead. Only meant for boards that were validated when they were compiled.
+    """
+
+    player = object.__new__(user_type)
+    object.__setattr__(player, "__dict__", values)
+    object.__setattr__(player, "__pydantic_fields_set__", set(values))
+    object.__setattr__(player, "__pydantic_extra__", None)
+    object.__setattr__(player, "__pydantic_private__", None)
+    return player
+
+
+def score_field(user_type: Type[models.BaseUser]) -> str | None:
+    for field in SCORE_FIELDS:
+        if field in user_type.model_fields:
+            return field
+    return None
+
+
+class ColumnarLeaderboard(Sequence[T]):
+    __slots__ = ("leaderboard", "platform", "user_type", "filters", "_columns", "_length", "_selection", "_rows")
+
+    def __init__(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None,
+        user_type: Type[T],
+        columns: dict[str, Column],
+        length: int,
+        selection: Sequence[int] | None = None,
+        filters: dict[str, Any] | None = None,
+        rows: dict[int, T] | None = None,
+    ):
+        self.leaderboard = leaderboard
+        self.platform = platform
+        self.user_type = user_type
+        self.filters = filters
+
+        self._columns = columns
+        self._length = length
+        self._selection = selection
+        self._rows: dict[int, T] = {} if rows is None else rows
+
+    def __repr__(self):
+        return "{0}(leaderboard={1!r}, platform={2!r}, user_type={3}, rows={4})".format(
+            self.__class__.__name__,
+            self.leaderboard,
+            self.platform,
+            self.user_type.__name__,
+            len(self)
+        )
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> ColumnarLeaderboard[Any]:
+        meta = data.get("meta", {})
+        leaderboard = api.Leaderboard(meta["leaderboardVersion"])
+        platform = api.Platform(meta["leaderboardPlatform"]) if meta.get("leaderboardPlatform") else None
+        user_type = api.LEADERBOARD_USER_MAP[leaderboard]
+        rows = data["data"]
+
+        # Rows are built without validation later on, so the schema is checked once here.
+        try:
+            api.result_model(leaderboard).model_validate(data)
+        except ValidationError as e:
+            raise ValueError("Unable to validate model. Was bad data returned?") from e
+
+        columns: dict[str, Column] = {}
+        for name, field in user_type.model_fields.items():
+            alias = field.alias or name
+            values = (_empty_to_none(row.get(alias, row.get(name))) for row in rows)
+            try:
+                if _is_int_field(field.annotation):
+                    columns[name] = IntColumn.from_values(values)
+                else:
+                    columns[name] = StringColumn.from_values(values)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Unable to build column {name!r}. Was bad data returned?") from e
+
+        return ColumnarLeaderboard(leaderboard, platform, user_type, columns, len(rows))
+
+    @classmethod
+    def from_result(cls, result: api.LeaderboardResult[Any]) -> ColumnarLeaderboard[Any]:
+        user_type = api.LEADERBOARD_USER_MAP[result.leaderboard]
+        players = result.players
+
+        columns: dict[str, Column] = {}
+        for name, field in user_type.model_fields.items():
+            values = (getattr(player, name) for player in players)
+            if _is_int_field(field.annotation):
+                columns[name] = IntColumn.from_values(values)
+            else:
+                columns[name] = StringColumn.from_values(values)
+
+        return ColumnarLeaderboard(
+            result.leaderboard,
+            result.platform,
+            user_type,
+            columns,
+            len(players),
+            filters=result.filters,
+            rows=dict(enumerate(players)),
+        )
+
+    def __len__(self):
+        if self._selection is None:
+            return self._length
+        return len(self._selection)
+
+    def _physical(self, i: int) -> int:
+        if self._selection is None:
+            if i < 0:
+                i += self._length
+            if not 0 <= i < self._length:
+                raise IndexError("leaderboard index out of range")
+            return i
+        return self._selection[i]
+
+    def _materialize(self, row: int) -> T:
+        player = self._rows.get(row)
+        if player is None:
+            values = {name: column[row] for name, column in self._columns.items()}
+            for name, convert in _converters(self.user_type):
+                values[name] = convert(values[name])
+            player = self._rows[row] = construct_trusted(self.user_type, values)
+        return player
+
+    def _materialize_many(self, rows: Sequence[int], reading: int | None = None) -> list[T]:
+        # Column at a time, which is a lot cheaper than going through every column for each row.
+        cached = self._rows
+        missing = [row for row in rows if row not in cached]
+
+        if missing:
+            converters = dict(_converters(self.user_type))
+            names: list[str] = []
+            columns: list[list[Any]] = []
+
+            for name, column in self._columns.items():
+                convert = converters.get(name)
+                if isinstance(column, StringColumn):
+                    # Decoding the whole table (and keeping it) only pays off when a good part of it is read.
+                    table = column.decoded_for(missing, len(missing) if reading is None else reading)
+                    if convert is not None:
+                        items = table.items() if isinstance(table, dict) else enumerate(table)
+                        table = {code: None if value is None else convert(value) for code, value in items}
+                    codes = column.codes
+                    values = [table[codes[row]] for row in missing]
+                else:
+                    values = [column.values[row] for row in missing]
+                    if convert is not None:
+                        values = [convert(value) for value in values]
+
+                names.append(name)
+                columns.append(values)
+
+            for row, row_values in zip(missing, zip(*columns)):
+                cached[row] = construct_trusted(self.user_type, dict(zip(names, row_values)))
+
+        return [cached[row] for row in rows]
+
+    @overload
+    def __getitem__(self, i: int) -> T: ...
+    @overload
+    def __getitem__(self, i: slice) -> ColumnarLeaderboard[T]: ...
+
+    def __getitem__(self, i: int | slice):
+        if isinstance(i, slice):
+            return self._view(self.physical_rows()[i], self.filters)
+        return self._materialize(self._physical(i))
+
+    def take(self, indices: Iterable[int]) -> list[T]:
+        """Players at the given positions, decoded together."""
+
+        return self._materialize_many([self._physical(i) for i in indices])
+
+    def __iter__(self) -> Iterator[T]:
+        rows = self.physical_rows()
+        for start in range(0, len(rows), _MATERIALIZE_CHUNK):
+            yield from self._materialize_many(rows[start:start + _MATERIALIZE_CHUNK], len(rows))
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the columns, which are shared by all views of a board."""
+
+        return sum(column.nbytes for column in self._columns.values())
+
+    @property
+    def materialized(self) -> Collection[T]:
+        """Rows decoded so far, shared by all views of a board."""
+
+        return self._rows.values()
+
+    def physical_rows(self) -> Sequence[int]:
+        if self._selection is None:
+            return range(self._length)
+        return self._selection
+
+    def column(self, field: str) -> Column | None:
+        if field == "score" and field not in self._columns:
+            field = score_field(self.user_type) or field
+        return self._columns.get(field)
+
+    def column_values(self, field: str) -> list[Any]:
+        column = self.column(field)
+        if column is None:
+            raise KeyError(field)
+
+        rows = self.physical_rows()
+        if isinstance(column, StringColumn):
+            table, codes = column.decoded_for(rows, len(rows)), column.codes
+            return [table[codes[row]] for row in rows]
+        values = column.values
+        return [values[row] for row in rows]
+
+    def _view(self, selection: Sequence[int], filters: dict[str, Any] | None) -> ColumnarLeaderboard[T]:
+        return self.__class__(
+            self.leaderboard,
+            self.platform,
+            self.user_type,
+            self._columns,
+            self._length,
+            selection=selection,
+            filters=filters,
+            rows=self._rows,
+        )
+
+    def filter(self, plan: filtering.FilterPlan | None = None, /, **filters) -> ColumnarLeaderboard[T]:
+        if plan is None:
+            plan = filtering.compile_filters(**filters)
+        elif filters:
+            plan = filtering.compile_filters(**{**plan.filters, **filters})
+
+        selection: Sequence[int] = self.physical_rows()
+
+        for predicate in plan.predicates:
+            if not selection:
+                break
+
+            column = self.column(predicate.field)
+            if column is not None:
+                selection = column.select(predicate, selection)
+            elif predicate.field == "score":  # e.g. Season 2, where score is always None
+                if not predicate.test(None):
+                    selection = []
+            elif hasattr(self.user_type, predicate.field):
+                selection = [row for row in selection if predicate(self._materialize(row))]
+
+        if isinstance(selection, range):
+            selection = list(selection)
+
+        return self._view(selection, dict(plan.filters))
+
+    def to_bytes(self, meta: dict[str, Any] | None = None) -> bytes:
+        """
+        Serializes the selected rows in a memory-mappable format:
+        magic, header length, JSON header, then 8-byte aligned little-endian column blobs.
+        """
+
+        if meta is None:
+            meta = {"leaderboardVersion": self.leaderboard.value}
+            if self.platform:
+                meta["leaderboardPlatform"] = self.platform.value
+
+        rows = self.physical_rows()
+        blobs: list[bytes] = []
+        offset = 0
+
+        def add(blob: bytes) -> int:
+            nonlocal offset
+            padding = -offset % _BINARY_ALIGN
+            blobs.append(b"\0" * padding)
+            start = offset + padding
+            blobs.append(blob)
+            offset = start + len(blob)
+            return start
+
+        columns = []
+        for name, column in self._columns.items():
+            if isinstance(column, IntColumn):
+                values = [column[row] for row in rows]
+                fits_int32 = all(_INT32_MIN <= v <= _INT32_MAX for v in values)
+                typed = array("i" if fits_int32 else "q", values)
+                columns.append({
+                    "name": name,
+                    "kind": "int",
+                    "typecode": typed.typecode,
+                    "offset": add(_little_endian(typed)),
+                })
+            else:
+                table = list(column.table)
+                encoded = [b""] + [(value or "").encode("utf-8") for value in table[1:]]  # Only code 0 is None
+                string_offsets = array("I", [0])
+                for value in encoded:
+                    string_offsets.append(string_offsets[-1] + len(value))
+                columns.append({
+                    "name": name,
+                    "kind": "str",
+                    "codes_offset": add(_little_endian(array("I", (column.codes[row] for row in rows)))),
+                    "table_offset": add(_little_endian(string_offsets)),
+                    "table_length": len(table),
+                    "strings_offset": add(b"".join(encoded)),
+                    "strings_length": string_offsets[-1],
+                })
+
+        header = json.dumps({"meta": meta, "rows": len(rows), "columns": columns}).encode("utf-8")
+        prefix = BINARY_MAGIC + struct.pack("<I", len(header)) + header
+        prefix += b"\0" * (-len(prefix) % _BINARY_ALIGN)
+        return prefix + b"".join(blobs)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> ColumnarLeaderboard[Any]:
+        """Loads a board written by `to_bytes` without copying the column data out of the buffer (e.g. an mmap)."""
+
+        buffer = memoryview(buffer)
+        if bytes(buffer[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+            raise ValueError("Not a binary leaderboard file")
+
+        (header_len,) = struct.unpack_from("<I", buffer, len(BINARY_MAGIC))
+        header_start = len(BINARY_MAGIC) + 4
+        header = json.loads(bytes(buffer[header_start:header_start + header_len]))
+        data_start = header_start + header_len
+        data_start += -data_start % _BINARY_ALIGN
+
+        meta = header["meta"]
+        leaderboard = api.Leaderboard(meta["leaderboardVersion"])
+        platform = api.Platform(meta["leaderboardPlatform"]) if meta.get("leaderboardPlatform") else None
+        length = header["rows"]
+
+        columns: dict[str, Column] = {}
+        for spec in header["columns"]:
+            if spec["kind"] == "int":
+                columns[spec["name"]] = IntColumn(_cast(buffer, data_start + spec["offset"], spec["typecode"], length))
+            else:
+                strings_start = data_start + spec["strings_offset"]
+                columns[spec["name"]] = StringColumn(
+                    _cast(buffer, data_start + spec["codes_offset"], "I", length),
+                    BinaryStringTable(
+                        _cast(buffer, data_start + spec["table_offset"], "I", spec["table_length"] + 1),
+                        buffer[strings_start:strings_start + spec["strings_length"]],
+                    ),
+                )
+
+        return ColumnarLeaderboard(leaderboard, platform, api.LEADERBOARD_USER_MAP[leaderboard], columns, length)
+
+    def to_result(self, lazy: bool = False) -> api.LeaderboardResult[T]:
+        """
+        With `lazy`, the result keeps this board as its players and rows are only built when accessed. Rows are never
+        validated, either way: they were validated when the board was compiled.
+        """
+
+        return api.LeaderboardResult[self.user_type].model_construct(
+            leaderboard=self.leaderboard,
+            platform=self.platform,
+            filters=self.filters,
+            players=self if lazy else list(self),
+        )
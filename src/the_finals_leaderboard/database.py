@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import datetime
+import functools
+import os
+import re
+import sqlite3
+import threading
+from enum import Enum
+from typing import Any, Iterable, Iterator, Type
+
+from the_finals_leaderboard import api, caching, columnar, diffing, filtering, indexing, models
+
+_SCHEMA_VERSION = 1
+
+# Board columns get an index (per board) when a user model has them, text ones get a case-insensitive one too.
+INDEXED_FIELDS = (*indexing.NAME_FIELDS, "club_tag", "rank", *columnar.SCORE_FIELDS)
+_NOCASE_FIELDS = frozenset((*indexing.NAME_FIELDS, "club_tag"))
+
+_COMPARISONS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+_CASE_INSENSITIVE_OPS = ("iexact", "icontains", "istartswith", "iendswith")
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _glob_escape(value: str) -> str:
+    return re.sub(r"([*?\[])", r"[\1]", value)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(pattern: str, flags: int) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def _regexp(pattern: str, value: Any, flags: int = 0) -> bool:
+    try:
+        return _compile(pattern, flags).search(str(value)) is not None
+    except Exception:
+        return False
+
+
+def _normalized_op(op_name: str):
+    op_func = filtering.NORMALIZED_OPS[op_name]
+
+    def test(value: Any, target: Any) -> bool:
+        try:
+            return op_func(value, target)
+        except Exception:
+            return False
+
+    return test
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _resolve_enum(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _platform(leaderboard: api.Leaderboard, platform: api.Platform | None) -> api.Platform | None:
+    if platform is None:
+        platforms = api.LEADERBOARD_PLATFORM_MAP.get(leaderboard, ())
+        if len(platforms) == 1:
+            return platforms[0]
+        return None
+    return api.Platform(platform)
+
+
+class _Table():
+    """Layout of the table holding every board of one user model."""
+
+    __slots__ = ("user_type", "name", "fields", "kinds", "score")
+
+    def __init__(self, user_type: Type[models.BaseUser]):
+        self.user_type = user_type
+        self.name = user_type.__name__
+        self.fields = tuple(user_type.model_fields)
+        self.kinds = {
+            name: "int" if columnar._is_int_field(field.annotation) else "str"
+            for name, field in user_type.model_fields.items()
+        }
+        self.score = columnar.score_field(user_type)
+
+    def create(self) -> str:
+        columns = ", ".join(
+            f"{_quote(name)} {'INTEGER' if kind == 'int' else 'TEXT'}" for name, kind in self.kinds.items()
+        )
+        return (
+            f"CREATE TABLE IF NOT EXISTS {_quote(self.name)} "
+            f"(board INTEGER NOT NULL, row INTEGER NOT NULL, {columns}, PRIMARY KEY (board, row)) WITHOUT ROWID"
+        )
+
+    def create_indexes(self) -> list[str]:
+        statements = []
+        for field in INDEXED_FIELDS:
+            if field not in self.kinds:
+                continue
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {_quote(f'{self.name}_{field}')} "
+                f"ON {_quote(self.name)} (board, {_quote(field)})"
+            )
+            if field in _NOCASE_FIELDS:
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'{self.name}_{field}_nocase')} "
+                    f"ON {_quote(self.name)} (board, {_quote(field)} COLLATE NOCASE)"
+                )
+        return statements
+
+    def column(self, field: str) -> str | None:
+        if field == "score" and field not in self.kinds:
+            field = self.score or field
+        return field if field in self.kinds else None
+
+    def condition(self, predicate: filtering.Predicate) -> tuple[str, list[Any]] | None:
+        """SQL equivalent of a predicate, None when it has to be tested on the players instead."""
+
+        field = self.column(predicate.field)
+        if field is None:
+            if predicate.field == "score":  # e.g. Season 2, where score is always None
+                return ("1" if predicate.test(None) else "0"), []
+            if hasattr(self.user_type, predicate.field):
+                return None
+            return "1", []  # Filters on missing fields are ignored, like with lists of players
+
+        column, kind = _quote(field), self.kinds[field]
+        target = predicate.target
+        match predicate.op_name:
+            case "exact":
+                if target is None:
+                    return f"{column} IS NULL", []
+                if (kind == "int" and _is_number(target)) or (kind == "str" and isinstance(target, str)):
+                    return f"{column} = ?", [target]
+                return "0", []
+            case "gt" | "gte" | "lt" | "lte":
+                if (kind == "int" and _is_number(target)) or (kind == "str" and isinstance(target, str)):
+                    return f"{column} {_COMPARISONS[predicate.op_name]} ?", [target]
+                return "0", []
+            case "isnull" | "exists":
+                match_null, match_value = target == True, target == False  # noqa: E712, 1 and 0 count too
+                if predicate.op_name == "exists":
+                    match_null, match_value = match_value, match_null
+                if match_null:
+                    return f"{column} IS NULL", []
+                if match_value:
+                    return f"{column} IS NOT NULL", []
+                return "0", []
+            case "contains":
+                if kind == "str" and isinstance(target, str):
+                    return f"instr({column}, ?) > 0", [target]
+                return "0", []
+            case "startswith" | "endswith":
+                # Same as str(value).startswith(...), which also matches None as "None".
+                target = str(target)
+                text = column if kind == "str" else f"CAST({column} AS TEXT)"
+                if predicate.op_name == "startswith":
+                    sql, pattern, matches_none = f"{text} GLOB ?", _glob_escape(target) + "*", "None".startswith(target)
+                else:
+                    sql, pattern, matches_none = f"{text} GLOB ?", "*" + _glob_escape(target), "None".endswith(target)
+                if matches_none:
+                    sql = f"({sql} OR {column} IS NULL)"
+                return sql, [pattern]
+            case "iexact" | "icontains" | "istartswith" | "iendswith":
+                target = filtering.TARGET_NORMALIZERS[predicate.op_name](target)
+                sql, params = f"tfl_{predicate.op_name}({column}, ?)", [target]
+                if (
+                    predicate.op_name == "iexact"
+                    and field in _NOCASE_FIELDS
+                    and target.isascii()
+                    and target != "none"  # str(None)
+                ):
+                    # Narrowed down with the case-insensitive index first.
+                    sql, params = f"{column} = ? COLLATE NOCASE AND {sql}", [target, *params]
+                return sql, params
+            case "regex" | "iregex":
+                try:
+                    re.compile(target)
+                except Exception:  # Never matches, like an invalid regex in a Python filter
+                    return "0", []
+                if predicate.op_name == "regex":
+                    return f"{column} REGEXP ?", [target]
+                return f"tfl_iregexp(?, {column})", [target]
+            case _:
+                return None
+
+
+class LeaderboardDatabase():
+    """
+    SQLite copy of leaderboards for queries across many boards, one table per user model.
+
+    Filters use the same `field__op` syntax as `LeaderboardResult.filter` and are translated to SQL that can use the
+    per-board indexes on names, club tags, ranks and scores. Regexes and case-insensitive operators go through
+    functions registered on the connection, so they match exactly what a Python filter would.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:"):
+        self.path = os.fspath(path)
+        self._lock = threading.RLock()
+        self._tables: dict[Type[models.BaseUser], _Table] = {}
+        self._ready: set[str] = set()  # Tables known to exist with their indexes
+
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.create_function("regexp", 2, _regexp, deterministic=True)
+        self._connection.create_function(
+            "tfl_iregexp", 2, lambda pattern, value: _regexp(pattern, value, re.IGNORECASE), deterministic=True
+        )
+        for op_name in _CASE_INSENSITIVE_OPS:
+            self._connection.create_function(f"tfl_{op_name}", 2, _normalized_op(op_name), deterministic=True)
+
+        with self._lock, self._connection:
+            (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+            if version == 0:
+                self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS boards ("
+                    "id INTEGER PRIMARY KEY, leaderboard TEXT NOT NULL, platform TEXT NOT NULL, "
+                    "user_table TEXT NOT NULL, rows INTEGER NOT NULL, static INTEGER NOT NULL, updated REAL NOT NULL, "
+                    "UNIQUE (leaderboard, platform))"
+                )
+            elif version != _SCHEMA_VERSION:
+                self._connection.close()
+                raise ValueError(f"{self.path} was written by an incompatible version (schema {version})")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _key(leaderboard: api.Leaderboard, platform: api.Platform | None) -> tuple[str, str]:
+        platform = _platform(leaderboard, platform)
+        return leaderboard.value, platform.value if platform else ""
+
+    def _table(self, leaderboard: api.Leaderboard, indexes: bool = True) -> _Table:
+        user_type = api.LEADERBOARD_USER_MAP[leaderboard]
+        table = self._tables.get(user_type)
+        if table is None:
+            table = self._tables[user_type] = _Table(user_type)
+
+        if table.name not in self._ready:
+            exists = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table.name,)
+            ).fetchone()
+            if not exists:
+                self._connection.execute(table.create())
+            # A new table can be indexed after it's filled, which is a lot faster than updating the indexes per row.
+            if exists or indexes:
+                for statement in table.create_indexes():
+                    self._connection.execute(statement)
+                self._ready.add(table.name)
+        return table
+
+    def _board_id(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> int | None:
+        row = self._connection.execute(
+            "SELECT id FROM boards WHERE leaderboard = ? AND platform = ?", LeaderboardDatabase._key(leaderboard, platform)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def boards(self) -> list[tuple[api.Leaderboard, api.Platform | None]]:
+        with self._lock:
+            rows = self._connection.execute("SELECT leaderboard, platform FROM boards").fetchall()
+        order = indexing._leaderboard_order()
+        boards = [(api.Leaderboard(leaderboard), api.Platform(platform) if platform else None) for leaderboard, platform in rows]
+        boards.sort(key=lambda board: (order[board[0]], board[1] or ""))
+        return boards
+
+    def _store(self, result: api.LeaderboardResult, static: bool, indexes: bool = True):
+        leaderboard, players = result.leaderboard, result.players
+        table = self._table(leaderboard, indexes)
+        columns = [diffing.field_values(players, field) for field in table.fields]
+        if not isinstance(players, columnar.ColumnarLeaderboard):  # Columns already hold plain values
+            columns = [[_resolve_enum(value) for value in values] for values in columns]
+
+        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        board_id = self._board_id(leaderboard, result.platform)
+        if board_id is None:
+            board_id = self._connection.execute(
+                "INSERT INTO boards (leaderboard, platform, user_table, rows, static, updated) VALUES (?, ?, ?, ?, ?, ?)",
+                (*LeaderboardDatabase._key(leaderboard, result.platform), table.name, len(players), static, now),
+            ).lastrowid
+        else:
+            self._connection.execute(
+                "UPDATE boards SET user_table = ?, rows = ?, static = ?, updated = ? WHERE id = ?",
+                (table.name, len(players), static, now, board_id),
+            )
+            self._connection.execute(f"DELETE FROM {_quote(table.name)} WHERE board = ?", (board_id,))
+
+        self._connection.executemany(
+            f"INSERT INTO {_quote(table.name)} VALUES ({', '.join('?' * (len(table.fields) + 2))})",
+            ((board_id, row, *values) for row, values in enumerate(zip(*columns))),
+        )
+
+    def ingest(self, result: api.LeaderboardResult, static: bool = False):
+        """Stores a board, replacing the previous version of it."""
+
+        with self._lock, self._connection:
+            self._store(result, static)
+
+    def ingest_static(self):
+        """Stores every board of the static bundle that isn't stored yet, in a single transaction."""
+
+        with self._lock, self._connection:
+            stored = set(self._connection.execute("SELECT leaderboard, platform FROM boards WHERE static"))
+            touched: set[api.Leaderboard] = set()
+            for fname in caching.list_static_fname():
+                board = caching.load_static_binary_fname(fname)
+                if LeaderboardDatabase._key(board.leaderboard, board.platform) not in stored:
+                    self._store(board.to_result(lazy=True), static=True, indexes=False)
+                    touched.add(board.leaderboard)
+
+            for leaderboard in touched:
+                self._table(leaderboard)
+            if touched:
+                self._connection.execute("ANALYZE")
+
+    def query(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+        /,
+        **filters: Any,
+    ) -> api.LeaderboardResult:
+        leaderboard = api.Leaderboard(leaderboard)
+        platform = _platform(leaderboard, platform)
+        plan = filtering.compile_filters(**filters)
+
+        with self._lock:
+            board_id = self._board_id(leaderboard, platform)
+            if board_id is None:
+                raise ValueError(f"{leaderboard.value} isn't in the database")
+            table = self._table(leaderboard)
+
+            conditions, params, remaining = ["board = ?"], [board_id], []
+            for predicate in plan.predicates:
+                condition = table.condition(predicate)
+                if condition is None:
+                    remaining.append(predicate)
+                else:
+                    conditions.append(condition[0])
+                    params.extend(condition[1])
+
+            rows = self._connection.execute(
+                f"SELECT {', '.join(map(_quote, table.fields))} FROM {_quote(table.name)} "
+                f"WHERE {' AND '.join(conditions)} ORDER BY row",
+                params,
+            ).fetchall()
+
+        # Column at a time, like ColumnarLeaderboard does, only enum columns need converting.
+        fields, user_type = table.fields, table.user_type
+        columns: list[Any] = list(zip(*rows))
+        if columns:
+            for name, convert in columnar._converters(user_type):
+                i = fields.index(name)
+                columns[i] = [None if value is None else convert(value) for value in columns[i]]
+
+        construct = columnar.construct_trusted
+        players = [construct(user_type, dict(zip(fields, values))) for values in zip(*columns)]
+        if remaining:
+            players = [player for player in players if all(predicate(player) for predicate in remaining)]
+
+        return api.result_model(leaderboard).model_construct(
+            leaderboard=leaderboard,
+            platform=platform,
+            filters=dict(plan.filters) if filters else None,
+            players=players,
+        )
+
+    def query_many(
+        self,
+        leaderboards: Iterable[api.Leaderboard | tuple[api.Leaderboard, api.Platform | None]] | None = None,
+        /,
+        **filters: Any,
+    ) -> Iterator[api.LeaderboardResult]:
+        """Runs the same query on each board, every stored board by default."""
+
+        if leaderboards is None:
+            boards = self.boards()
+        else:
+            boards = [
+                (request, None) if isinstance(request, (api.Leaderboard, str)) else request
+                for request in leaderboards
+            ]
+
+        for leaderboard, platform in boards:
+            yield self.query(leaderboard, platform, **filters)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
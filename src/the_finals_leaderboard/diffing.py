@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from dataclasses import dataclass
+from typing import Any, Generic, Sequence, TypeVar
+
+from the_finals_leaderboard import api, columnar, indexing
+
+T = TypeVar("T")
+
+# Embark, Steam, Xbox and PSN names. A name seen twice on one board gets an occurrence number appended.
+PlayerKey = tuple[Any, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerChange(Generic[T]):
+    key: PlayerKey
+    player: T  # Last seen version for players that left
+    previous: T | None
+    old_row: int | None
+    new_row: int | None
+    old_rank: int | None
+    new_rank: int | None
+    rank_delta: int | None  # Positive when the player climbed
+    score_delta: int | None
+
+
+@dataclass(slots=True)
+class ChangeSet():
+    """
+    Row level changes between two versions of a board, enough to update row based indexes in place.
+
+    `row_map` maps every old row to its new row (-1 for players that left), `entered` has the new row and key of
+    every player that wasn't on the old board.
+    """
+
+    old_length: int
+    new_length: int
+    row_map: array
+    entered: list[tuple[int, PlayerKey]]
+
+    def __bool__(self):
+        return bool(self.entered) or self.old_length != self.new_length or any(
+            new_row != old_row for old_row, new_row in enumerate(self.row_map)
+        )
+
+
+@dataclass(slots=True)
+class LeaderboardDiff(Generic[T]):
+    leaderboard: api.Leaderboard
+    platform: api.Platform | None
+    entered: list[PlayerChange[T]]
+    left: list[PlayerChange[T]]
+    moved: list[PlayerChange[T]]  # Rank or score changed
+    unchanged: int
+    changes: ChangeSet
+
+    def __bool__(self):
+        return bool(self.entered or self.left or self.moved)
+
+
+def field_values(players: Sequence[Any], field: str | None) -> Sequence[Any]:
+    if field is not None:
+        if isinstance(players, columnar.ColumnarLeaderboard):
+            # Read straight from the columns, rows are only materialized for players that changed.
+            if players.column(field) is not None:
+                return players.column_values(field)
+        elif players and hasattr(players[0], field):
+            return [getattr(player, field) for player in players]
+    return [None] * len(players)
+
+
+def _take(players: Sequence[T], rows: Sequence[int]) -> list[T]:
+    if isinstance(players, columnar.ColumnarLeaderboard):
+        return players.take(rows)
+    return [players[row] for row in rows]
+
+
+def _delta(before: Any, after: Any) -> int | None:
+    if before is None or after is None:
+        return None
+    return after - before
+
+
+def player_keys(players: Sequence[Any]) -> tuple[list[PlayerKey], dict[PlayerKey, int]]:
+    keys: list[PlayerKey]
+    if isinstance(players, columnar.ColumnarLeaderboard):
+        keys = list(zip(*(field_values(players, field) for field in indexing.NAME_FIELDS)))
+    else:
+        keys = list(map(operator.attrgetter(*indexing.NAME_FIELDS), players))
+
+    rows = {key: row for row, key in enumerate(keys)}
+    if len(rows) == len(keys):
+        return keys, rows
+
+    rows = {}
+    for row, key in enumerate(keys):
+        if key in rows:
+            n = 1
+            while (*key, n) in rows:
+                n += 1
+            key = keys[row] = (*key, n)
+        rows[key] = row
+
+    return keys, rows
+
+
+def diff(old: api.LeaderboardResult[T], new: api.LeaderboardResult[T]) -> LeaderboardDiff[T]:
+    if old.leaderboard != new.leaderboard or old.platform != new.platform:
+        raise ValueError("Only results of the same leaderboard and platform can be diffed")
+
+    score = columnar.score_field(api.LEADERBOARD_USER_MAP[new.leaderboard])
+    old_players, new_players = old.players, new.players
+
+    old_keys, old_rows = player_keys(old_players)
+    new_keys, _ = player_keys(new_players)
+    old_ranks, new_ranks = field_values(old_players, "rank"), field_values(new_players, "rank")
+    old_scores, new_scores = field_values(old_players, score), field_values(new_players, score)
+
+    row_map = array("i", [-1]) * len(old_keys)
+    entered_rows: list[int] = []
+    moved_rows: list[tuple[int, int]] = []
+
+    for new_row, key in enumerate(new_keys):
+        old_row = old_rows.get(key)
+        if old_row is None:
+            entered_rows.append(new_row)
+            continue
+
+        row_map[old_row] = new_row
+        if old_ranks[old_row] != new_ranks[new_row] or old_scores[old_row] != new_scores[new_row]:
+            moved_rows.append((old_row, new_row))
+
+    left_rows = [old_row for old_row, new_row in enumerate(row_map) if new_row == -1]
+
+    entered = [
+        PlayerChange(new_keys[row], player, None, None, row, None, new_ranks[row], None, None)
+        for row, player in zip(entered_rows, _take(new_players, entered_rows))
+    ]
+    left = [
+        PlayerChange(old_keys[row], player, None, row, None, old_ranks[row], None, None, None)
+        for row, player in zip(left_rows, _take(old_players, left_rows))
+    ]
+    moved = [
+        PlayerChange(
+            new_keys[new_row],
+            player,
+            previous,
+            old_row,
+            new_row,
+            old_ranks[old_row],
+            new_ranks[new_row],
+            _delta(new_ranks[new_row], old_ranks[old_row]),  # Swapped, climbing means a lower rank number
+            _delta(old_scores[old_row], new_scores[new_row]),
+        )
+        for (old_row, new_row), player, previous in zip(
+            moved_rows,
+            _take(new_players, [new_row for _, new_row in moved_rows]),
+            _take(old_players, [old_row for old_row, _ in moved_rows]),
+        )
+    ]
+
+    return LeaderboardDiff(
+        leaderboard=new.leaderboard,
+        platform=new.platform,
+        entered=entered,
+        left=left,
+        moved=moved,
+        unchanged=len(new_keys) - len(entered) - len(moved),
+        changes=ChangeSet(len(old_keys), len(new_keys), row_map, [(row, new_keys[row]) for row in entered_rows]),
+    )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import operator
 import re
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, Callable, Iterable, Mapping, Sequence, TypeVar
 
 OPS = {
     "exact": operator.eq,
@@ -30,6 +31,53 @@ OPS = {
 }
 
 
+# Target normalization done once per filter, instead of once per player.
+TARGET_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "iexact": lambda b: str(b).lower(),
+    "icontains": lambda b: str(b).lower(),
+    "startswith": str,
+    "istartswith": lambda b: str(b).lower(),
+    "endswith": str,
+    "iendswith": lambda b: str(b).lower(),
+    "regex": re.compile,
+    "iregex": lambda b: re.compile(b, re.IGNORECASE),
+}
+
+# Same semantics as OPS, but operating on a target already passed through TARGET_NORMALIZERS.
+NORMALIZED_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "iexact": lambda a, b: str(a).lower() == b,
+    "icontains": lambda a, b: b in str(a).lower(),
+    "startswith": lambda a, b: str(a).startswith(b),
+    "istartswith": lambda a, b: str(a).lower().startswith(b),
+    "endswith": lambda a, b: str(a).endswith(b),
+    "iendswith": lambda a, b: str(a).lower().endswith(b),
+    "regex": lambda a, b: b.search(str(a)) is not None,
+    "iregex": lambda a, b: b.search(str(a)) is not None,
+}
+
+# Rough relative cost of each operator, cheapest predicates are evaluated first.
+OP_COSTS = {
+    "isnull": 0,
+    "exists": 0,
+    "exact": 1,
+    "gt": 1,
+    "gte": 1,
+    "lt": 1,
+    "lte": 1,
+    "contains": 2,
+    "startswith": 2,
+    "endswith": 2,
+    "iexact": 3,
+    "icontains": 3,
+    "istartswith": 3,
+    "iendswith": 3,
+    "regex": 4,
+    "iregex": 4,
+}
+
+_MISSING = object()
+
+
 def _resolve_enum(value: Any) -> Any:
     if isinstance(value, Enum):
         return value.value
@@ -59,19 +107,136 @@ def passes_filter(item: Any, field: str, op_name: str, target_value: Any) -> boo
         return False
 
 
+def parse_expr(expr: str) -> tuple[str, str]:
+    if "__" in expr:
+        field, op_name = expr.split("__", 1)
+    else:
+        field, op_name = expr, "exact"
+    return field, op_name
+
+
+class Predicate():
+    __slots__ = ("field", "op_name", "target", "cost", "_test")
+
+    def __init__(self, field: str, op_name: str, target_value: Any):
+        op_func = OPS.get(op_name)
+        if not op_func:
+            raise ValueError(f"Unsupported operator: {op_name}")
+
+        self.field = field
+        self.op_name = op_name
+        self.target = _resolve_enum(target_value)
+        self.cost = OP_COSTS.get(op_name, max(OP_COSTS.values()) + 1)
+
+        normalizer = TARGET_NORMALIZERS.get(op_name)
+        if normalizer is None:
+            target = self.target
+        else:
+            try:
+                target = normalizer(self.target)
+            except Exception:  # e.g. an invalid regex, which can never match
+                self._test = lambda a: False
+                return
+            op_func = NORMALIZED_OPS[op_name]
+
+        self._test = lambda a: op_func(a, target)
+
+    def __repr__(self):
+        return "{0}({1!r}, {2!r}, {3!r})".format(
+            self.__class__.__name__,
+            self.field,
+            self.op_name,
+            self.target
+        )
+
+    def test(self, value: Any) -> bool:
+        try:
+            return self._test(_resolve_enum(value))
+        except Exception:
+            return False
+
+    def __call__(self, item: Any) -> bool:
+        val = getattr(item, self.field, _MISSING)
+        if val is _MISSING:
+            return True
+        if isinstance(val, Enum):
+            val = val.value
+
+        try:
+            return self._test(val)
+        except Exception:
+            return False
+
+
+class FilterPlan():
+    __slots__ = ("filters", "predicates")
+
+    def __init__(self, filters: Mapping[str, Any]):
+        self.filters = dict(filters)
+        self.predicates = tuple(sorted(
+            (Predicate(*parse_expr(expr), target_value) for expr, target_value in self.filters.items()),
+            key=lambda p: p.cost
+        ))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.filters!r})"
+
+    def __bool__(self):
+        return bool(self.predicates)
+
+    def __call__(self, item: Any) -> bool:
+        for predicate in self.predicates:
+            if not predicate(item):
+                return False
+        return True
+
+    def apply(self, players: Iterable[T], indexes: Mapping[str, Any] | None = None) -> list[T]:
+        if indexes and isinstance(players, Sequence):
+            indexed = self.apply_indexed(players, indexes)
+            if indexed is not None:
+                return indexed
+
+        if not self.predicates:
+            return list(players)
+        if len(self.predicates) == 1:
+            return [player for player in players if self.predicates[0](player)]
+        return [player for player in players if self(player)]
+
+    def apply_indexed(self, players: Sequence[T], indexes: Mapping[str, Any]) -> list[T] | None:
+        best: tuple[Predicate, list[int]] | None = None
+        for predicate in self.predicates:
+            index = indexes.get(predicate.field)
+            if index is None:
+                continue
+
+            positions = index.lookup(predicate)
+            if positions is not None and (best is None or len(positions) < len(best[1])):
+                best = (predicate, positions)
+
+        if best is None:
+            return None
+
+        served, positions = best
+        rest = [predicate for predicate in self.predicates if predicate is not served]
+        return [
+            players[i]
+            for i in positions
+            if all(predicate(players[i]) for predicate in rest)
+        ]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(items: tuple[tuple[str, type, Any], ...]) -> FilterPlan:
+    return FilterPlan({expr: target_value for expr, _, target_value in items})
+
+
+def compile_filters(**filters) -> FilterPlan:
+    try:
+        # The type is part of the key since e.g. True == 1, but "true" != "1"
+        return _compile_cached(tuple((expr, type(v), v) for expr, v in filters.items()))
+    except TypeError:  # Unhashable target value
+        return FilterPlan(filters)
+
+
 def extended_filter(players: list[T], **filters) -> list[T]:
-    filtered = []
-    for player in players:
-        keep = True
-        for expr, target_value in filters.items():
-            if "__" in expr:
-                field, op_name = expr.split("__", 1)
-            else:
-                field, op_name = expr, "exact"
-
-            if not passes_filter(player, field, op_name, target_value):
-                keep = False
-                break
-        if keep:
-            filtered.append(player)
-    return filtered
+    return compile_filters(**filters).apply(players)
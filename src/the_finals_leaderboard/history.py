@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import json
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import BinaryIO, Iterator, Sequence
+
+from the_finals_leaderboard import api, columnar, diffing, indexing
+
+_MAGIC = b"TFLHIST1"
+_HEADER = struct.Struct("<BdI")  # Kind, timestamp, compressed payload length
+_COUNTS = struct.Struct("<IIII")
+_NONE = -(1 << 63)  # Stored in place of a missing rank or score
+_SUFFIX = ".tflh"
+
+
+class _Kind(IntEnum):
+    KEYFRAME = 1
+    DELTA = 2
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryPoint():
+    timestamp: datetime.datetime
+    rank: int | None
+    score: int | None
+
+
+@dataclass(slots=True)
+class _Record():
+    kind: _Kind
+    timestamp: float
+    # Players that entered, every player on the board for keyframes. Ids are given out in this order.
+    keys: list[diffing.PlayerKey]
+    ranks: array
+    scores: array
+    # Sorted by id, so a query can look up the few players it follows without going through the whole delta.
+    left: array
+    changed: array
+    changed_ranks: array
+    changed_scores: array
+
+
+def _pack(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(data: memoryview, offset: int, count: int, typecode: str) -> tuple[array, int]:
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
+
+
+def _encode(record: _Record) -> bytes:
+    names = json.dumps(record.keys, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    payload = b"".join((
+        _COUNTS.pack(len(record.keys), len(record.left), len(record.changed), len(names)),
+        names,
+        _pack(record.ranks),
+        _pack(record.scores),
+        _pack(record.left),
+        _pack(record.changed),
+        _pack(record.changed_ranks),
+        _pack(record.changed_scores),
+    ))
+    # Snapshots are written every few minutes, the fastest level compresses almost as well.
+    return zlib.compress(payload, 1)
+
+
+def _decode(kind: _Kind, timestamp: float, compressed: bytes) -> _Record:
+    data = memoryview(zlib.decompress(compressed))
+    n_entered, n_left, n_changed, n_names = _COUNTS.unpack_from(data)
+    offset = _COUNTS.size
+
+    keys = [tuple(key) for key in json.loads(bytes(data[offset:offset + n_names]))]
+    offset += n_names
+    ranks, offset = _unpack(data, offset, n_entered, "q")
+    scores, offset = _unpack(data, offset, n_entered, "q")
+    left, offset = _unpack(data, offset, n_left, "I")
+    changed, offset = _unpack(data, offset, n_changed, "I")
+    changed_ranks, offset = _unpack(data, offset, n_changed, "q")
+    changed_scores, offset = _unpack(data, offset, n_changed, "q")
+
+    return _Record(kind, timestamp, keys, ranks, scores, left, changed, changed_ranks, changed_scores)
+
+
+def _optional(value: int) -> int | None:
+    return None if value == _NONE else value
+
+
+class _State():
+    """Players on a board as of the last record, indexed by id. Ids are only stable between keyframes."""
+
+    __slots__ = ("ids", "keys", "ranks", "scores", "since_keyframe")
+
+    def __init__(self):
+        self.ids: dict[diffing.PlayerKey, int] = {}
+        self.keys: list[diffing.PlayerKey | None] = []  # None once the player left
+        self.ranks = array("q")
+        self.scores = array("q")
+        self.since_keyframe = 0
+
+    def apply(self, record: _Record):
+        if record.kind == _Kind.KEYFRAME:
+            self.__init__()
+        else:
+            self.since_keyframe += 1
+
+        keys, ranks, scores = self.keys, self.ranks, self.scores
+        for player in record.left:
+            del self.ids[keys[player]]
+            keys[player] = None
+        for player, rank, score in zip(record.changed, record.changed_ranks, record.changed_scores):
+            ranks[player] = rank
+            scores[player] = score
+
+        self.ids.update(zip(record.keys, range(len(keys), len(keys) + len(record.keys))))
+        keys.extend(record.keys)
+        ranks.extend(record.ranks)
+        scores.extend(record.scores)
+
+    def snapshot(self) -> tuple[list[diffing.PlayerKey], array, array]:
+        alive = [player for player, key in enumerate(self.keys) if key is not None]
+        return (
+            [key for key in self.keys if key is not None],
+            array("q", (self.ranks[player] for player in alive)),
+            array("q", (self.scores[player] for player in alive)),
+        )
+
+    def delta(self, timestamp: float, keys: Sequence[diffing.PlayerKey], ranks: array, scores: array) -> _Record:
+        n = len(self.keys)
+        new_ranks, new_scores = array("q", self.ranks), array("q", self.scores)
+        seen = bytearray(n)
+        entered: list[int] = []
+
+        ids = self.ids
+        for row, key in enumerate(keys):
+            player = ids.get(key)
+            if player is None:
+                entered.append(row)
+                continue
+            seen[player] = 1
+            new_ranks[player] = ranks[row]
+            new_scores[player] = scores[row]
+
+        old_ranks, old_scores, alive = self.ranks, self.scores, self.keys
+        changed = array("I", (
+            player for player in range(n)
+            if seen[player] and (new_ranks[player] != old_ranks[player] or new_scores[player] != old_scores[player])
+        ))
+
+        return _Record(
+            _Kind.DELTA,
+            timestamp,
+            [keys[row] for row in entered],
+            array("q", (ranks[row] for row in entered)),
+            array("q", (scores[row] for row in entered)),
+            array("I", (player for player in range(n) if not seen[player] and alive[player] is not None)),
+            changed,
+            array("q", (new_ranks[player] for player in changed)),
+            array("q", (new_scores[player] for player in changed)),
+        )
+
+
+class _BoardLog():
+    """
+    Append-only log of one board: a keyframe with every player, followed by deltas against the previous snapshot.
+
+    Only record headers are kept in memory (as arrays), so seeking to a point in time never decodes a payload.
+    """
+
+    __slots__ = ("path", "timestamps", "offsets", "keyframes", "_state", "_writer")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.timestamps = array("d")
+        self.offsets = array("q")
+        self.keyframes = array("q")  # Positions (in timestamps/offsets) of the keyframes
+        self._state: _State | None = None
+        self._writer: BinaryIO | None = None
+        self._scan()
+
+    def _scan(self):
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as fp:
+            if fp.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{self.path} is not a leaderboard history file")
+
+            size = os.fstat(fp.fileno()).st_size
+            offset = len(_MAGIC)
+            while offset + _HEADER.size <= size:
+                kind, timestamp, length = _HEADER.unpack(fp.read(_HEADER.size))
+                if offset + _HEADER.size + length > size:
+                    break
+                if kind == _Kind.KEYFRAME:
+                    self.keyframes.append(len(self.timestamps))
+                self.timestamps.append(timestamp)
+                self.offsets.append(offset)
+                offset += _HEADER.size + length
+                fp.seek(offset)
+
+        if offset < size:  # A write that was cut short
+            with open(self.path, "r+b") as fp:
+                fp.truncate(offset)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def records(self, start: int = 0, stop: int | None = None) -> Iterator[_Record]:
+        if stop is None:
+            stop = len(self.timestamps)
+        if start >= stop:
+            return
+
+        with open(self.path, "rb") as fp:
+            fp.seek(self.offsets[start])
+            for _ in range(start, stop):
+                kind, timestamp, length = _HEADER.unpack(fp.read(_HEADER.size))
+                yield _decode(_Kind(kind), timestamp, fp.read(length))
+
+    def keyframe_before(self, timestamp: float) -> int:
+        """Position of the last keyframe at or before the timestamp, or the first keyframe."""
+
+        i = bisect.bisect_right(self.timestamps, timestamp)
+        k = bisect.bisect_right(self.keyframes, i - 1) - 1
+        return self.keyframes[max(k, 0)] if self.keyframes else 0
+
+    def _load_state(self) -> _State:
+        if self._state is None:
+            state = _State()
+            if self.keyframes:
+                for record in self.records(self.keyframes[-1]):
+                    state.apply(record)
+            self._state = state
+        return self._state
+
+    def append(self, timestamp: float, keys: Sequence[diffing.PlayerKey], ranks: array, scores: array, keyframe_interval: int):
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            raise ValueError("Snapshots must be appended in chronological order")
+
+        state = self._load_state()
+        if not self.keyframes or state.since_keyframe + 1 >= keyframe_interval:
+            empty_ids, empty_values = array("I"), array("q")
+            record = _Record(_Kind.KEYFRAME, timestamp, list(keys), ranks, scores, empty_ids, empty_ids, empty_values, empty_values)
+        else:
+            record = state.delta(timestamp, keys, ranks, scores)
+
+        if self._writer is None:
+            new = not self.path.exists()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = open(self.path, "ab")
+            if new:
+                self._writer.write(_MAGIC)
+
+        payload = _encode(record)
+        offset = self._writer.tell()
+        self._writer.write(_HEADER.pack(record.kind, timestamp, len(payload)))
+        self._writer.write(payload)
+        self._writer.flush()
+
+        state.apply(record)
+        if record.kind == _Kind.KEYFRAME:
+            self.keyframes.append(len(self.timestamps))
+        self.timestamps.append(timestamp)
+        self.offsets.append(offset)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _timestamp(value: datetime.datetime | None, default: float) -> float:
+    if value is None:
+        return default
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+def _datetime(timestamp: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+class HistoryStore():
+    """
+    Snapshot history of leaderboards, one append-only file per board in `directory`.
+
+    Every `keyframe_interval`-th snapshot is stored whole and the others as deltas against the previous one, so a
+    query only decodes the records from the closest keyframe before its start. Memory use is bounded by one board
+    per open log, both when writing and reading.
+    """
+
+    def __init__(self, directory: str | os.PathLike, keyframe_interval: int = 288):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+
+        self.directory = Path(directory)
+        self.keyframe_interval = keyframe_interval
+        self._logs: dict[str, _BoardLog] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.directory)!r}, keyframe_interval={self.keyframe_interval})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _name(leaderboard: api.Leaderboard, platform: api.Platform | None) -> str:
+        leaderboard, platform = api.Leaderboard(leaderboard), api.Platform(platform) if platform else None
+        if platform is None:
+            platforms = api.LEADERBOARD_PLATFORM_MAP.get(leaderboard, ())
+            if len(platforms) == 1:
+                platform = platforms[0]
+        return f"leaderboard_{leaderboard.value}{'_'+platform.value if platform else ''}"
+
+    def _log(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> _BoardLog:
+        name = HistoryStore._name(leaderboard, platform)
+        log = self._logs.get(name)
+        if log is None:
+            log = self._logs[name] = _BoardLog(self.directory / (name + _SUFFIX))
+        return log
+
+    def append(self, result: api.LeaderboardResult, timestamp: datetime.datetime | None = None):
+        players = result.players
+        score = columnar.score_field(api.LEADERBOARD_USER_MAP[result.leaderboard])
+        keys, _ = diffing.player_keys(players)
+        ranks = array("q", (_NONE if value is None else value for value in diffing.field_values(players, "rank")))
+        scores = array("q", (_NONE if value is None else value for value in diffing.field_values(players, score)))
+
+        now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        with self._lock:
+            log = self._log(result.leaderboard, result.platform)
+            log.append(_timestamp(timestamp, now), keys, ranks, scores, self.keyframe_interval)
+
+    def timestamps(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None) -> list[datetime.datetime]:
+        with self._lock:
+            return [_datetime(timestamp) for timestamp in self._log(leaderboard, platform).timestamps]
+
+    def player_history(
+        self,
+        name: str,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ) -> list[HistoryPoint]:
+        """
+        Rank and score of a player (by Embark, Steam, Xbox or PSN name) in every snapshot between `start` and `end`.
+
+        Snapshots the player isn't on are skipped.
+        """
+
+        target = indexing.normalize_name(name)
+        t1, t2 = _timestamp(start, float("-inf")), _timestamp(end, float("inf"))
+
+        def matches(key: diffing.PlayerKey) -> bool:
+            return any(isinstance(value, str) and indexing.normalize_name(value) == target for value in key[:len(indexing.NAME_FIELDS)])
+
+        points: list[HistoryPoint] = []
+        # Only the ids of the matching players are followed through the deltas.
+        tracked: dict[int, tuple[int, int]] = {}
+        next_id = 0
+
+        def find(ids: array, player: int) -> int | None:
+            i = bisect.bisect_left(ids, player)
+            return i if i < len(ids) and ids[i] == player else None
+
+        with self._lock:
+            log = self._log(leaderboard, platform)
+            for record in log.records(log.keyframe_before(t1), bisect.bisect_right(log.timestamps, t2)):
+                if record.kind == _Kind.KEYFRAME:
+                    tracked.clear()
+                    next_id = 0
+
+                for player in list(tracked):
+                    if find(record.left, player) is not None:
+                        del tracked[player]
+                    elif (i := find(record.changed, player)) is not None:
+                        tracked[player] = (record.changed_ranks[i], record.changed_scores[i])
+
+                for i, key in enumerate(record.keys):
+                    if matches(key):
+                        tracked[next_id + i] = (record.ranks[i], record.scores[i])
+                next_id += len(record.keys)
+
+                if tracked and record.timestamp >= t1:
+                    # Several players can share a name, the best placed one wins.
+                    rank, score = min(tracked.values(), key=lambda value: (value[0] == _NONE, value[0]))
+                    points.append(HistoryPoint(_datetime(record.timestamp), _optional(rank), _optional(score)))
+
+        return points
+
+    def compact(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None = None,
+        resolution: datetime.timedelta = datetime.timedelta(hours=1),
+        older_than: datetime.datetime | None = None,
+    ):
+        """
+        Keeps one snapshot per `resolution` among the ones taken before `older_than` (all of them by default), and
+        rewrites the rest of the log with fresh keyframes.
+        """
+
+        cutoff = _timestamp(older_than, float("inf"))
+        step = resolution.total_seconds()
+
+        with self._lock:
+            log = self._log(leaderboard, platform)
+            log.close()
+            if not len(log):
+                return
+
+            tmp_path = log.path.with_suffix(".tmp")
+            tmp_path.unlink(missing_ok=True)
+            compacted = _BoardLog(tmp_path)
+
+            state = _State()
+            bucket = None
+            try:
+                for record in log.records():
+                    state.apply(record)
+                    if record.timestamp < cutoff:
+                        current = record.timestamp // step
+                        if current == bucket:
+                            continue
+                        bucket = current
+                    compacted.append(record.timestamp, *state.snapshot(), self.keyframe_interval)
+            finally:
+                compacted.close()
+
+            tmp_path.replace(log.path)
+            del self._logs[HistoryStore._name(leaderboard, platform)]
+
+    def close(self):
+        with self._lock:
+            for log in self._logs.values():
+                log.close()
+            self._logs.clear()
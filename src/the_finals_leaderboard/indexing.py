@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Literal
+
+from the_finals_leaderboard import api, filtering
+
+if TYPE_CHECKING:
+    from the_finals_leaderboard import diffing
+
+IndexKind = Literal["hash", "sorted"]
+
+# Fields that get a sorted index when no kind is given, everything else gets a hash index.
+SORTED_FIELDS = frozenset((
+    "score",
+    "rank",
+    "rank_score",
+    "points",
+    "fans",
+    "fame",
+    "cashouts",
+    "change",
+    "league_number",
+    "xp",
+    "level",
+))
+
+
+def _resolve_enum(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class HashIndex():
+    """Serves `exact` and `iexact` lookups."""
+
+    __slots__ = ("field", "_exact", "_iexact")
+
+    def __init__(self, field: str, values: Iterable[Any]):
+        self.field = field
+        self._exact: dict[Any, list[int]] = {}
+        self._iexact: dict[str, list[int]] = {}
+
+        for i, value in enumerate(values):
+            value = _resolve_enum(value)
+            self._exact.setdefault(value, []).append(i)
+            self._iexact.setdefault(str(value).lower(), []).append(i)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field!r}, keys={len(self._exact)})"
+
+    def lookup(self, predicate: filtering.Predicate) -> list[int] | None:
+        match predicate.op_name:
+            case "exact":
+                try:
+                    return self._exact.get(predicate.target, [])
+                except TypeError:  # Unhashable target
+                    return None
+            case "iexact":
+                return self._iexact.get(str(predicate.target).lower(), [])
+            case _:
+                return None
+
+
+class SortedIndex():
+    """Serves `exact`, `gt`, `gte`, `lt` and `lte` lookups on numeric fields as bisect range scans."""
+
+    __slots__ = ("field", "_keys", "_positions")
+
+    def __init__(self, field: str, values: Iterable[Any]):
+        # None can never satisfy a comparison, so it's left out of the index entirely.
+        pairs = sorted(
+            (value, i)
+            for i, value in enumerate(_resolve_enum(value) for value in values)
+            if value is not None
+        )
+
+        self.field = field
+        self._keys = [value for value, _ in pairs]
+        self._positions = [i for _, i in pairs]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.field!r}, keys={len(self._keys)})"
+
+    def lookup(self, predicate: filtering.Predicate) -> list[int] | None:
+        target = predicate.target
+        if not isinstance(target, (int, float)) or isinstance(target, bool):
+            return None
+
+        keys = self._keys
+        match predicate.op_name:
+            case "exact":
+                lo, hi = bisect.bisect_left(keys, target), bisect.bisect_right(keys, target)
+            case "gt":
+                lo, hi = bisect.bisect_right(keys, target), len(keys)
+            case "gte":
+                lo, hi = bisect.bisect_left(keys, target), len(keys)
+            case "lt":
+                lo, hi = 0, bisect.bisect_left(keys, target)
+            case "lte":
+                lo, hi = 0, bisect.bisect_right(keys, target)
+            case _:
+                return None
+
+        # Back to leaderboard order
+        return sorted(self._positions[lo:hi])
+
+
+Index = HashIndex | SortedIndex
+
+
+def build_index(field: str, values: Iterable[Any], kind: IndexKind) -> Index:
+    match kind:
+        case "hash":
+            return HashIndex(field, values)
+        case "sorted":
+            return SortedIndex(field, values)
+        case _:
+            raise ValueError(f"Unsupported index kind: {kind}")
+
+
+NAME_FIELDS = ("name", "steam_name", "xbox_name", "psn_name")
+
+_ROW_BITS = 24
+_ROW_MASK = (1 << _ROW_BITS) - 1
+_PLAYER_INDEX_MAGIC = b"TFLPIDX2"
+
+
+@functools.cache
+def _leaderboard_order() -> dict[api.Leaderboard, int]:
+    return {leaderboard: i for i, leaderboard in enumerate(api.Leaderboard)}
+
+
+def normalize_name(name: str) -> str:
+    return name.strip().casefold()
+
+
+def name_hash(name: str) -> int:
+    # Stable across processes (unlike hash()), so it can be persisted.
+    digest = hashlib.blake2b(normalize_name(name).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerAppearance():
+    leaderboard: api.Leaderboard
+    platform: api.Platform | None
+    row: int
+
+
+class PlayerIndex():
+    """
+    Inverted index from normalized player name (Embark, Steam, Xbox and PSN) to the boards they appear on.
+
+    The bulk of the index is a pair of sorted arrays (name hashes and packed board/row postings) built from the
+    static bundle, boards that are refreshed afterwards are kept in a small per-board overlay that replaces their
+    postings in the base arrays.
+    """
+
+    __slots__ = ("bundle", "_boards", "_board_ids", "_hashes", "_postings", "_overlays")
+
+    def __init__(
+        self,
+        boards: Iterable[tuple[api.Leaderboard, api.Platform | None]] = (),
+        hashes: array | None = None,
+        postings: array | None = None,
+        bundle: str | None = None,
+    ):
+        self.bundle = bundle  # Fingerprint of the static files the base arrays were built from
+        self._boards: list[tuple[api.Leaderboard, api.Platform | None]] = list(boards)
+        self._board_ids = {board: i for i, board in enumerate(self._boards)}
+        self._hashes = array("q") if hashes is None else hashes
+        self._postings = array("I") if postings is None else postings
+        self._overlays: dict[int, dict[int, list[int]]] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(boards={len(self._boards)}, postings={len(self._postings)}, live={len(self._overlays)})"
+
+    def __len__(self):
+        return len(self._postings) + sum(len(rows) for overlay in self._overlays.values() for rows in overlay.values())
+
+    def _board_id(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> int:
+        board = (leaderboard, platform)
+        board_id = self._board_ids.get(board)
+        if board_id is None:
+            board_id = self._board_ids[board] = len(self._boards)
+            self._boards.append(board)
+        return board_id
+
+    @staticmethod
+    def _row_hashes(names: Iterable[str | None]) -> set[int]:
+        return {name_hash(name) for name in names if name and name.strip()}
+
+    @classmethod
+    def build(
+        cls,
+        boards: Iterable[tuple[api.Leaderboard, api.Platform | None, Iterable[Iterable[str | None]]]],
+        bundle: str | None = None,
+    ):
+        index = cls(bundle=bundle)
+        pairs: list[tuple[int, int]] = []
+
+        for leaderboard, platform, rows in boards:
+            board_id = index._board_id(leaderboard, platform)
+            for row, names in enumerate(rows):
+                for h in cls._row_hashes(names):
+                    pairs.append((h, board_id << _ROW_BITS | row))
+
+        pairs.sort()
+        index._hashes = array("q", (h for h, _ in pairs))
+        index._postings = array("I", (p for _, p in pairs))
+        return index
+
+    def update_board(self, leaderboard: api.Leaderboard, platform: api.Platform | None, rows: Iterable[Iterable[str | None]]):
+        overlay: dict[int, list[int]] = {}
+        for row, names in enumerate(rows):
+            for h in self._row_hashes(names):
+                overlay.setdefault(h, []).append(row)
+
+        self._overlays[self._board_id(leaderboard, platform)] = overlay
+
+    def apply_changes(
+        self,
+        leaderboard: api.Leaderboard,
+        platform: api.Platform | None,
+        changes: diffing.ChangeSet,
+        rows: Iterable[Iterable[str | None]],
+    ):
+        """
+        Moves the postings of a board to their new rows, only the names of players that entered are hashed.
+
+        `rows` are the names of the new board, only read when the index has nothing for it yet: the changes don't
+        say who stayed on a board the index never saw, so it is indexed in full with `update_board`.
+        """
+
+        board_id = self._board_id(leaderboard, platform)
+        overlay = self._overlays.get(board_id)
+        if overlay is None:
+            overlay = {}
+            for h, posting in zip(self._hashes, self._postings):
+                if posting >> _ROW_BITS == board_id:
+                    overlay.setdefault(h, []).append(posting & _ROW_MASK)
+            if not overlay:
+                self.update_board(leaderboard, platform, rows)
+                return
+
+        row_map = changes.row_map
+        updated: dict[int, list[int]] = {}
+        for h, old_rows in overlay.items():
+            moved = [row_map[row] for row in old_rows if row < len(row_map) and row_map[row] >= 0]
+            if moved:
+                updated[h] = moved
+
+        for row, key in changes.entered:
+            for h in self._row_hashes(key[:len(NAME_FIELDS)]):
+                updated.setdefault(h, []).append(row)
+
+        self._overlays[board_id] = updated
+
+    def find(self, name: str) -> list[PlayerAppearance]:
+        h = name_hash(name)
+        found: list[tuple[int, int]] = []
+
+        hashes, postings = self._hashes, self._postings
+        i = bisect.bisect_left(hashes, h)
+        while i < len(hashes) and hashes[i] == h:
+            board_id, row = postings[i] >> _ROW_BITS, postings[i] & _ROW_MASK
+            if board_id not in self._overlays:
+                found.append((board_id, row))
+            i += 1
+
+        for board_id, overlay in self._overlays.items():
+            found.extend((board_id, row) for row in overlay.get(h, ()))
+
+        appearances = [PlayerAppearance(*self._boards[board_id], row) for board_id, row in found]
+        order = _leaderboard_order()
+        appearances.sort(key=lambda a: (order[a.leaderboard], a.platform or "", a.row))
+        return appearances
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps({
+            "bundle": self.bundle,
+            "boards": [[leaderboard.value, platform.value if platform else None] for leaderboard, platform in self._boards],
+        })
+        hashes, postings = array("q", self._hashes), array("I", self._postings)
+        if sys.byteorder != "little":
+            hashes.byteswap()
+            postings.byteswap()
+
+        header_bytes = header.encode("utf-8")
+        return b"".join((
+            _PLAYER_INDEX_MAGIC,
+            struct.pack("<II", len(header_bytes), len(hashes)),
+            header_bytes,
+            hashes.tobytes(),
+            postings.tobytes(),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        if data[:len(_PLAYER_INDEX_MAGIC)] != _PLAYER_INDEX_MAGIC:
+            raise ValueError("Not a player index file")
+
+        offset = len(_PLAYER_INDEX_MAGIC)
+        header_len, count = struct.unpack_from("<II", data, offset)
+        offset += 8
+        header = json.loads(data[offset:offset + header_len])
+        boards = [
+            (api.Leaderboard(leaderboard), api.Platform(platform) if platform else None)
+            for leaderboard, platform in header["boards"]
+        ]
+        offset += header_len
+
+        hashes, postings = array("q"), array("I")
+        hashes.frombytes(data[offset:offset + count * hashes.itemsize])
+        offset += count * hashes.itemsize
+        postings.frombytes(data[offset:offset + count * postings.itemsize])
+        if sys.byteorder != "little":
+            hashes.byteswap()
+            postings.byteswap()
+
+        return cls(boards, hashes, postings, header["bundle"])
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from the_finals_leaderboard import api
+
+
+class Phase(StrEnum):
+    CACHE_LOOKUP = "cache_lookup"  # Includes STATIC_LOAD when the board has to be read from the disk
+    STATIC_LOAD = "static_load"
+    FETCH = "fetch"  # HTTP round-trip, including the body
+    PARSE = "parse"  # JSON decoding and validation happen in one pass, so they are timed together
+    FILTER = "filter"
+
+
+class CacheOutcome(StrEnum):
+    HIT = "hit"
+    MISS = "miss"
+    STATIC = "static"  # Not in memory, read from the static files on disk
+    STALE = "stale"
+    NOT_MODIFIED = "not_modified"
+
+
+@dataclass(slots=True, frozen=True)
+class MetricEvent():
+    kind: Phase | CacheOutcome
+    leaderboard: api.Leaderboard
+    platform: api.Platform | None
+    duration: float | None = None  # Seconds, only for phases
+    bytes: int | None = None
+    rows: int | None = None
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        return {
+            "kind": self.kind.value,
+            "leaderboard": self.leaderboard.value,
+            "platform": self.platform.value if self.platform else "",
+        }
+
+
+MetricsHook = Callable[[MetricEvent], None]
+
+
+class OpenTelemetryHook():
+    """
+    Records events with an OpenTelemetry `Meter`, e.g. `OpenTelemetryHook(metrics.get_meter("the_finals_leaderboard"))`.
+
+    Only the meter passed in is used, so OpenTelemetry itself isn't a dependency.
+    """
+
+    def __init__(self, meter: Any, prefix: str = "the_finals_leaderboard"):
+        self._duration = meter.create_histogram(f"{prefix}.phase.duration", unit="s")
+        self._bytes = meter.create_counter(f"{prefix}.phase.bytes", unit="By")
+        self._rows = meter.create_counter(f"{prefix}.phase.rows")
+        self._cache = meter.create_counter(f"{prefix}.cache")
+
+    def __call__(self, event: MetricEvent):
+        attributes = event.attributes
+        if isinstance(event.kind, CacheOutcome):
+            self._cache.add(1, attributes)
+            return
+
+        if event.duration is not None:
+            self._duration.record(event.duration, attributes)
+        if event.bytes is not None:
+            self._bytes.add(event.bytes, attributes)
+        if event.rows is not None:
+            self._rows.add(event.rows, attributes)
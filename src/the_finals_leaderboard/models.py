@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from enum import IntEnum, StrEnum
 from typing import TypeAlias, Union
 
@@ -158,6 +159,15 @@ def _to_camel(string: str) -> str:
 # Base classes
 
 
+@functools.cache
+def _string_fields(model: type[BaseModel]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Names of the optional and required string fields of a model."""
+
+    optional = tuple(k for k, field in model.model_fields.items() if field.annotation == str | None)
+    required = tuple(k for k, field in model.model_fields.items() if field.annotation is str)
+    return optional, required
+
+
 class BaseUser(BaseModel):
     name: str | None  # Theres a dude in OB who has no name lol check index 3301
     steam_name: str | None
@@ -167,15 +177,24 @@ class BaseUser(BaseModel):
     model_config = {
         "alias_generator": _to_camel,
         "populate_by_name": True,
+        "frozen": True,  # Validated players are shared between cached results
+        "defer_build": True,  # Schemas are built on first use instead of at import
     }
 
-    @model_validator(mode="before")
-    @classmethod
-    def preprocess(cls, values: dict):
-        for k, v in values.items():
-            if isinstance(v, str) and not v.strip():
-                values[k] = None
-        return values
+    # After validation, so pydantic-core can validate raw JSON rows without building a dict for this first. Only
+    # optional names become None, a blank required string (e.g. a sponsor) is rejected.
+    @model_validator(mode="after")
+    def preprocess(self):
+        values = self.__dict__
+        optional, required = _string_fields(type(self))
+        for k in optional:
+            v = values[k]
+            if v is not None and not v.strip():
+                object.__setattr__(self, k, None)  # Frozen, so past pydantic's __setattr__
+        for k in required:
+            if not values[k].strip():
+                raise ValueError(f"{k} can't be blank")
+        return self
 
 
 class TaggedUser(BaseModel):
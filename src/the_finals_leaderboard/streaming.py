@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import codecs
+import json
+from enum import Enum, auto
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_ROWS_KEY = "data"
+
+
+class _State(Enum):
+    START = auto()
+    KEY = auto()
+    COLON = auto()
+    VALUE = auto()
+    ROW = auto()
+    AFTER_ROW = auto()
+    AFTER_VALUE = auto()
+    DONE = auto()
+
+
+class LeaderboardParser():
+    """
+    Incremental parser for a leaderboard response body.
+
+    Bytes are fed in as they arrive and the rows of the top level `data` array are returned one by one, so only
+    the current row (and the unconsumed tail of the last chunk) is ever held in memory. Other top level values,
+    such as `meta`, are small and are decoded whole into `extra`.
+    """
+
+    __slots__ = ("extra", "_decoder", "_utf8", "_buffer", "_pos", "_state", "_key")
+
+    def __init__(self):
+        self.extra: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _State.START
+        self._key = ""
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[dict[str, Any]]:
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        rows = self._parse(final=True)
+        if self._state != _State.DONE:
+            raise ValueError("Truncated leaderboard response")
+        return rows
+
+    def _skip_whitespace(self) -> bool:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _expect(self, char: str):
+        if self._buffer[self._pos] != char:
+            raise ValueError(f"Expected {char!r} at {self._buffer[self._pos:self._pos + 20]!r}")
+        self._pos += 1
+
+    def _decode_value(self, final: bool) -> tuple[bool, Any]:
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise ValueError("Invalid leaderboard response") from e
+            return False, None
+
+        # A number at the very end of the buffer might continue in the next chunk.
+        if end == len(self._buffer) and not final and not isinstance(value, (str, list, dict)):
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _parse(self, final: bool) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+
+        while self._state != _State.DONE and self._skip_whitespace():
+            char = self._buffer[self._pos]
+
+            match self._state:
+                case _State.START:
+                    self._expect("{")
+                    self._state = _State.KEY
+
+                case _State.KEY:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _State.DONE
+                        continue
+
+                    done, key = self._decode_value(final)
+                    if not done:
+                        break
+                    if not isinstance(key, str):
+                        raise ValueError("Invalid leaderboard response")
+                    self._key = key
+                    self._state = _State.COLON
+
+                case _State.COLON:
+                    self._expect(":")
+                    self._state = _State.VALUE
+
+                case _State.VALUE:
+                    if self._key == _ROWS_KEY and char == "[":
+                        self._pos += 1
+                        self._state = _State.ROW
+                        continue
+
+                    done, value = self._decode_value(final)
+                    if not done:
+                        break
+                    self.extra[self._key] = value
+                    self._state = _State.AFTER_VALUE
+
+                case _State.ROW:
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _State.AFTER_VALUE
+                        continue
+
+                    done, row = self._decode_value(final)
+                    if not done:
+                        break
+                    rows.append(row)
+                    self._state = _State.AFTER_ROW
+
+                case _State.AFTER_ROW:
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _State.AFTER_VALUE
+                    else:
+                        self._expect(",")
+                        self._state = _State.ROW
+
+                case _State.AFTER_VALUE:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _State.DONE
+                    else:
+                        self._expect(",")
+                        self._state = _State.KEY
+
+        return rows
+
+
+def iter_rows(chunks: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    parser = LeaderboardParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
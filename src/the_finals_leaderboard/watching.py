@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import heapq
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Protocol
+
+import httpx
+
+from the_finals_leaderboard import api, diffing
+
+logger = logging.getLogger(__name__)
+
+Board = tuple[api.Leaderboard, api.Platform | None]
+
+
+class _Client(Protocol):
+    # What the watcher needs from `client.Client`.
+    async def _poll_async(self, leaderboard: api.Leaderboard, platform: api.Platform | None) -> api.LeaderboardResult: ...
+
+
+@dataclass(frozen=True, slots=True)
+class WatchEvent():
+    leaderboard: api.Leaderboard
+    platform: api.Platform | None
+    result: api.LeaderboardResult
+    diff: diffing.LeaderboardDiff | None  # None for the first snapshot of a board
+    timestamp: float  # From the watcher's clock
+
+
+class RequestBudget():
+    """At most `max_requests` in any window of `period` seconds."""
+
+    def __init__(self, max_requests: int, period: float, clock: Callable[[], float], sleep: Callable[[float], Awaitable[Any]]):
+        if max_requests < 1:
+            raise ValueError("max_requests must be at least 1")
+
+        self.max_requests = max_requests
+        self.period = period
+        self._clock = clock
+        self._sleep = sleep
+        self._sent: collections.deque[float] = collections.deque()
+
+    async def acquire(self):
+        while True:
+            now = self._clock()
+            while self._sent and self._sent[0] <= now - self.period:
+                self._sent.popleft()
+            if len(self._sent) < self.max_requests:
+                self._sent.append(now)
+                return
+            await self._sleep(self._sent[0] + self.period - now)
+
+
+_CLOSED = object()
+
+
+class Subscription():
+    """
+    Async iterator over the change events of a watcher.
+
+    A subscriber that falls `maxsize` events behind loses the oldest ones, so it can never hold up polling.
+    """
+
+    def __init__(self, watcher: Watcher, maxsize: int):
+        self._watcher = watcher
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+
+    def _push(self, item: Any):
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(item)
+
+    def close(self):
+        self._watcher._subscribers.discard(self)
+        self._push(_CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> WatchEvent:
+        item = await self._queue.get()
+        if item is _CLOSED:
+            self._push(_CLOSED)  # Stays closed
+            raise StopAsyncIteration
+        return item
+
+
+class Watcher():
+    """
+    Polls boards on their own schedule and pushes an event to subscribers whenever one changes.
+
+    Every board is polled each `interval` (plus or minus `jitter`), boards that come back unchanged (or fail) are
+    polled less and less often, up to `max_interval`. Requests go through the client, so they are conditional and
+    refresh its cache.
+    """
+
+    def __init__(
+        self,
+        client: _Client,
+        boards: Iterable[Board],
+        interval: float,
+        jitter: float = 0.1,
+        max_interval: float | None = None,
+        backoff: float = 2.0,
+        budget: RequestBudget | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.boards = list(dict.fromkeys(boards))
+        self.interval = interval
+        self.jitter = jitter
+        self.max_interval = max(interval, max_interval if max_interval is not None else interval * 4)
+        self.backoff = backoff
+        self.budget = budget
+
+        self._client = client
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+
+        self._subscribers: set[Subscription] = set()
+        self._results: dict[Board, api.LeaderboardResult] = {}
+        self._streaks: dict[Board, int] = {}  # Unchanged or failed polls in a row
+        self._schedule: list[tuple[float, int, Board]] = []
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(boards={len(self.boards)}, interval={self.interval}, running={self.running})"
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, maxsize: int = 100) -> Subscription:
+        subscription = Subscription(self, maxsize)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def next_poll(self, leaderboard: api.Leaderboard, platform: api.Platform | None = None) -> float | None:
+        for due, _, board in self._schedule:
+            if board[0] == leaderboard and (platform is None or board[1] == platform):
+                return due
+        return None
+
+    def _delay(self, board: Board) -> float:
+        delay = min(self.interval * self.backoff ** self._streaks.get(board, 0), self.max_interval)
+        return delay * (1 + self._rng.uniform(-self.jitter, self.jitter))
+
+    async def poll(self, board: Board) -> WatchEvent | None:
+        """Polls a board once, returning (and publishing) an event if it changed."""
+
+        leaderboard, platform = board
+        if self.budget is not None:
+            await self.budget.acquire()
+
+        try:
+            result = await self._client._poll_async(leaderboard, platform)
+        except (httpx.HTTPError, ValueError):
+            logger.warning("Polling %s failed", leaderboard.value, exc_info=True)
+            self._streaks[board] = self._streaks.get(board, 0) + 1
+            return None
+
+        # Against the last result this watcher saw, not the client's cache: another reader of the client may have
+        # fetched the new data first, then this request only got a 304 for it.
+        previous = self._results.get(board)
+        diff = previous.diff(result) if previous is not None and result is not previous else None
+        if previous is not None and not diff:
+            logger.info("%s unchanged, backing off", leaderboard.value)
+            self._streaks[board] = self._streaks.get(board, 0) + 1
+            return None
+
+        self._streaks[board] = 0
+        self._results[board] = result
+        event = WatchEvent(leaderboard, platform, result, diff, self._clock())
+        for subscription in list(self._subscribers):
+            subscription._push(event)
+        return event
+
+    async def _poll_and_reschedule(self, board: Board):
+        await self.poll(board)
+        heapq.heappush(self._schedule, (self._clock() + self._delay(board), next(self._counter), board))
+
+    async def run(self):
+        """
+        Polls boards as they come due, concurrently: a slow board doesn't hold up the others, only the budget
+        limits how many requests go out at once. A board is off the schedule while its poll is in flight.
+        """
+
+        now = self._clock()
+        self._schedule = [(now, i, board) for i, board in enumerate(self.boards)]
+        heapq.heapify(self._schedule)
+        self._counter = itertools.count(len(self._schedule))
+
+        in_flight: set[asyncio.Future] = set()
+        try:
+            while self._schedule or in_flight:
+                while self._schedule and self._schedule[0][0] <= self._clock():
+                    _, _, board = heapq.heappop(self._schedule)
+                    in_flight.add(asyncio.ensure_future(self._poll_and_reschedule(board)))
+
+                waiting = set(in_flight)
+                sleeper = None
+                if self._schedule:
+                    sleeper = asyncio.ensure_future(self._sleep(self._schedule[0][0] - self._clock()))
+                    waiting.add(sleeper)
+
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if sleeper is not None and sleeper not in done:
+                    sleeper.cancel()
+                for task in done:
+                    if task is not sleeper:
+                        in_flight.discard(task)
+                        task.result()  # Anything poll doesn't handle stops the watcher
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for subscription in list(self._subscribers):
+            subscription.close()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
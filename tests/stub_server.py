@@ -0,0 +1,115 @@
+"""
+Local stand-in for the leaderboard API, serving the bundled static boards so tests and benchmarks can run offline.
+
+Live boards (e.g. s9) don't have a bundled file, they're served from the closest bundled board instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from the_finals_leaderboard import api, caching
+
+# Bundled board used for each live board, the schemas match.
+LIVE_SOURCES = {
+    api.Leaderboard.S9: api.Leaderboard.S8,
+    api.Leaderboard.S9SPONSOR: api.Leaderboard.S8SPONSOR,
+    api.Leaderboard.S9WORLDTOUR: api.Leaderboard.S8WORLDTOUR,
+    api.Leaderboard.S9HEAD2HEAD: api.Leaderboard.S8HEAD2HEAD,
+    api.Leaderboard.S9POWERSHIFT: api.Leaderboard.S8POWERSHIFT,
+    api.Leaderboard.S9QUICKCASH: api.Leaderboard.S8QUICKCASH,
+    api.Leaderboard.S9TEAMDEATHMATCH: api.Leaderboard.S8TEAMDEATHMATCH,
+    api.Leaderboard.S9POINTBREAK: api.Leaderboard.S8QUICKCASH,
+}
+
+
+class StubServer():
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests: dict[str, int] = {}
+        self._bodies: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Server isn't running")
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def body(self, path: str) -> bytes:
+        with self._lock:
+            body = self._bodies.get(path)
+        if body is not None:
+            return body
+
+        # /v1/leaderboard/<leaderboard>[/<platform>]
+        parts = path.strip("/").split("/")
+        leaderboard = api.Leaderboard(parts[2])
+        platform = api.Platform(parts[3]) if len(parts) > 3 else None
+
+        data = caching.load_static_fname(caching.static_fname(LIVE_SOURCES.get(leaderboard, leaderboard), platform))
+        data["meta"]["leaderboardVersion"] = leaderboard.value
+        body = json.dumps(data).encode("utf-8")
+
+        with self._lock:
+            self._bodies[path] = body
+        return body
+
+    def start(self) -> StubServer:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests[self.path] = stub.requests.get(self.path, 0) + 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                try:
+                    body = stub.body(self.path)
+                except (IndexError, ValueError, FileNotFoundError):
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                etag = '"{0}"'.format(hashlib.blake2b(body, digest_size=16).hexdigest())
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
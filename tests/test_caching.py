@@ -0,0 +1,29 @@
+import os
+import stat
+
+from the_finals_leaderboard import api, caching
+
+BOARD = (api.Leaderboard.S8, api.Platform.CROSSPLAY)
+
+
+def test_binary_files_are_readable_by_other_users(tmp_path, monkeypatch):
+    monkeypatch.setenv("THE_FINALS_LEADERBOARD_CACHE", str(tmp_path))
+
+    path = caching.save_static_binary(caching.static_fname(*BOARD))
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_unreadable_binary_file_falls_back_to_json(tmp_path, monkeypatch):
+    monkeypatch.setenv("THE_FINALS_LEADERBOARD_CACHE", str(tmp_path))
+    fname = caching.static_fname(*BOARD)
+
+    # Up to date, but can't be opened as a file.
+    path = caching.save_static_binary(fname)
+    path.unlink()
+    path.mkdir()
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 3600))
+
+    board = caching.load_static_binary_fname(fname)
+
+    assert len(board) == len(caching.load_static(*BOARD)["data"])
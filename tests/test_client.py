@@ -0,0 +1,85 @@
+import asyncio
+import datetime
+import threading
+import time
+
+from the_finals_leaderboard import api, client, metrics
+
+BOARD = (api.Leaderboard.S9, api.Platform.CROSSPLAY)
+PATH = "/v1/leaderboard/s9/crossplay"
+
+
+def test_not_modified_reuses_cached_players(stub):
+    events = []
+    c = client.Client(url=stub.url, metrics=events.append)
+
+    first = c.get_leaderboard_sync(*BOARD)
+    second = c.get_leaderboard_sync(*BOARD, True)  # Past the cache, with If-None-Match
+
+    assert stub.requests[PATH] == 2
+    assert metrics.CacheOutcome.NOT_MODIFIED in [event.kind for event in events]
+    assert len(second.players) == len(first.players)
+    assert second.players[0] is first.players[0]
+
+
+def test_concurrent_misses_share_one_request(stub):
+    stub.latency = 0.2
+    c = client.Client(url=stub.url)
+
+    async def main():
+        return await asyncio.gather(*(c.get_leaderboard_async(*BOARD) for _ in range(10)))
+
+    results = asyncio.run(main())
+
+    assert stub.requests[PATH] == 1
+    assert len({len(result.players) for result in results}) == 1
+
+
+def test_stale_entries_are_served_while_revalidating(stub):
+    events = []
+    c = client.Client(
+        url=stub.url,
+        live_caching_ttl=datetime.timedelta(milliseconds=50),
+        max_staleness=60,
+        metrics=events.append,
+    )
+
+    first = c.get_leaderboard_sync(*BOARD)
+    time.sleep(0.1)
+    stale = c.get_leaderboard_sync(*BOARD)
+
+    assert metrics.CacheOutcome.STALE in [event.kind for event in events]
+    assert stale.players[0] is first.players[0]
+
+    # Revalidated in the background, the server answers 304 and the entry is fresh again.
+    deadline = time.monotonic() + 10
+    while metrics.CacheOutcome.NOT_MODIFIED not in [event.kind for event in events]:
+        assert time.monotonic() < deadline, "Stale entry was never revalidated"
+        time.sleep(0.01)
+    assert stub.requests[PATH] == 2
+
+
+def test_entry_is_validated_and_recorded_once(stub):
+    class History():
+        snapshots = 0
+
+        def append(self, result):
+            self.snapshots += 1
+
+    history = History()
+    c = client.Client(url=stub.url, history=history)
+    c.get_leaderboard_sync(*BOARD)
+
+    # Cached already validated, so readers never see the raw payload.
+    entry = c._cache.peek(client.Client._cache_key(*BOARD))
+    assert entry.result is not None and entry.data is None
+
+    # Readers racing on an entry that isn't validated yet share a single validation.
+    raw = client._CachedLeaderboard(stub.body(PATH), entry.exp_date)
+    threads = [threading.Thread(target=c._get_result, args=(BOARD[0], raw)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert history.snapshots == 2
@@ -0,0 +1,62 @@
+import pytest
+
+from the_finals_leaderboard import api, caching, filtering
+from the_finals_leaderboard.database import LeaderboardDatabase
+
+BOARDS = (
+    (api.Leaderboard.CB1, None),  # Fame as the score, no platform
+    (api.Leaderboard.S2, api.Platform.CROSSPLAY),  # No score field
+    (api.Leaderboard.S8, api.Platform.CROSSPLAY),  # Club tags
+    (api.Leaderboard.S8SPONSOR, api.Platform.CROSSPLAY),  # Sponsor names
+)
+
+
+def _filters(op, player):
+    """Filters for `op` built from a player on the board, with a few targets of the wrong type."""
+
+    name = player.name
+    return {
+        "exact": [("name", name), ("rank", player.rank), ("rank", str(player.rank)), ("steam_name", None)],
+        "iexact": [("name", name.upper()), ("rank", player.rank), ("club_tag", "none")],
+        "contains": [("name", "a"), ("name", name[1:4]), ("rank", 1)],
+        "icontains": [("name", "A"), ("sponsor", "O")],
+        "startswith": [("name", name[:2]), ("rank", 1), ("steam_name", "No")],
+        "istartswith": [("name", name[:2].upper()), ("rank", "1")],
+        "endswith": [("name", name[-3:]), ("rank", 9), ("name", "*")],
+        "iendswith": [("name", name[-3:].upper()), ("club_tag", "e")],
+        "gt": [("rank", 100), ("score", 1000), ("name", "m"), ("rank", "100")],
+        "gte": [("rank", player.rank), ("score", 0)],
+        "lt": [("rank", 50), ("name", "b")],
+        "lte": [("rank", player.rank), ("score", 1000)],
+        "isnull": [("club_tag", True), ("steam_name", False), ("rank", 2)],
+        "regex": [("name", r"^[a-m]"), ("name", "("), ("rank", r"^1\d$")],
+        "iregex": [("name", "^A"), ("club_tag", "^[A-Z]{2}$")],
+        "exists": [("steam_name", True), ("club_tag", False), ("league", True)],
+    }[op]
+
+
+@pytest.fixture(scope="module")
+def boards():
+    db = LeaderboardDatabase()
+    results = {}
+    for leaderboard, platform in BOARDS:
+        result = api.result_model(leaderboard).model_validate(caching.load_static(leaderboard, platform))
+        db.ingest(result)
+        results[leaderboard] = result
+    yield db, results
+    db.close()
+
+
+def _players(result):
+    return [(player.rank, player.name) for player in result.players]
+
+
+@pytest.mark.parametrize("leaderboard,platform", BOARDS, ids=[leaderboard.value for leaderboard, _ in BOARDS])
+@pytest.mark.parametrize("op", filtering.OPS)
+def test_query_matches_filter(boards, op, leaderboard, platform):
+    db, results = boards
+    result = results[leaderboard]
+
+    for field, target in _filters(op, result.players[3]):
+        filters = {f"{field}__{op}": target}
+        assert _players(db.query(leaderboard, platform, **filters)) == _players(result.filter(**filters)), filters
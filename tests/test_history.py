@@ -0,0 +1,76 @@
+import datetime
+
+from the_finals_leaderboard import api, caching
+from the_finals_leaderboard.history import HistoryPoint, HistoryStore
+
+BOARD = (api.Leaderboard.S8, api.Platform.CROSSPLAY)
+START = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+HOUR = datetime.timedelta(hours=1)
+SNAPSHOTS = 8
+MISSING = 5  # Snapshot the followed player isn't on
+
+
+def _snapshots():
+    data = caching.load_static(*BOARD)
+    model = api.result_model(BOARD[0])
+    rows = data["data"][:50]
+    followed = rows[3]
+
+    # The followed player climbs one rank and gains 100 points an hour, other players stay put.
+    for i in range(SNAPSHOTS):
+        if i == MISSING:
+            players = [row for row in rows if row is not followed]
+        else:
+            players = [{**followed, "rank": 40 - i, "rankScore": 1000 + 100 * i} if row is followed else row for row in rows]
+        yield START + i * HOUR, model.model_validate({**data, "data": players})
+
+
+def _point(i):
+    return HistoryPoint(START + i * HOUR, 40 - i, 1000 + 100 * i)
+
+
+def test_queries_across_keyframes_and_compaction(tmp_path):
+    snapshots = list(_snapshots())
+    name = snapshots[0][1].players[3].name
+
+    with HistoryStore(tmp_path, keyframe_interval=3) as store:  # Keyframes at 0, 3 and 6
+        for timestamp, result in snapshots:
+            store.append(result, timestamp)
+
+        # Starts after the first keyframe, so the window is read from the keyframe at 3.
+        points = store.player_history(name, *BOARD, start=START + 4 * HOUR, end=START + 7 * HOUR)
+        assert points == [_point(4), _point(6), _point(7)]
+        assert store.player_history(name, *BOARD, start=START + 1 * HOUR, end=START + 2 * HOUR) == [_point(1), _point(2)]
+
+        store.compact(*BOARD, resolution=2 * HOUR, older_than=START + 6 * HOUR)
+
+        assert store.timestamps(*BOARD) == [START + i * HOUR for i in (0, 2, 4, 6, 7)]
+        assert store.player_history(name, *BOARD) == [_point(0), _point(2), _point(4), _point(6), _point(7)]
+        assert store.player_history(name, *BOARD, start=START + 3 * HOUR, end=START + 6 * HOUR) == [_point(4), _point(6)]
+
+
+def test_truncated_record_is_cut_off_on_reopen(tmp_path):
+    snapshots = list(_snapshots())
+    name = snapshots[0][1].players[3].name
+
+    with HistoryStore(tmp_path, keyframe_interval=3) as store:
+        for timestamp, result in snapshots[:4]:
+            store.append(result, timestamp)
+    (path,) = tmp_path.iterdir()
+    size = path.stat().st_size
+
+    # A write cut short by a crash, half of the next record's header and payload.
+    with HistoryStore(tmp_path / "scratch", keyframe_interval=3) as scratch:
+        for timestamp, result in snapshots[:5]:
+            scratch.append(result, timestamp)
+    (scratch_path,) = (tmp_path / "scratch").iterdir()
+    record = scratch_path.read_bytes()[size:]
+    with open(path, "ab") as fp:
+        fp.write(record[:len(record) // 2])
+
+    with HistoryStore(tmp_path, keyframe_interval=3) as store:
+        assert store.timestamps(*BOARD) == [START + i * HOUR for i in range(4)]
+        assert path.stat().st_size == size
+
+        store.append(snapshots[4][1], snapshots[4][0])
+        assert store.player_history(name, *BOARD) == [_point(i) for i in range(5)]
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+import bench_import
+
+OPTIONAL_MODULES = (
+    "sqlite3",
+    "the_finals_leaderboard.database",
+    "the_finals_leaderboard.history",
+    "the_finals_leaderboard.streaming",
+    "the_finals_leaderboard.watching",
+)
+
+# The import budget is measured with these already imported, so the package importing them eagerly wouldn't show up.
+HEAVY_DEPENDENCIES = ("httpx", "pydantic")
+
+
+def test_import_budgets():
+    for name, values in bench_import.measure(runs=5).items():
+        assert min(values) <= bench_import.BUDGETS[name], f"{name} took {min(values):.1f} ms"
+
+
+def test_client_skips_optional_backends():
+    probe = "import json, sys, the_finals_leaderboard; the_finals_leaderboard.Client(); print(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+    loaded = set(json.loads(out))
+    assert loaded.isdisjoint(OPTIONAL_MODULES), loaded.intersection(OPTIONAL_MODULES)
+
+
+def test_package_import_skips_heavy_dependencies():
+    probe = "import json, sys, the_finals_leaderboard; print(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True).stdout
+    loaded = set(json.loads(out))
+    assert loaded.isdisjoint(HEAVY_DEPENDENCIES), loaded.intersection(HEAVY_DEPENDENCIES)
@@ -0,0 +1,61 @@
+import pytest
+
+from the_finals_leaderboard import api, caching, indexing
+
+BOARD = (api.Leaderboard.S8, api.Platform.CROSSPLAY)
+
+
+def _results():
+    data = caching.load_static(*BOARD)
+    model = api.result_model(BOARD[0])
+    rows = data["data"][:200]
+    old = model.model_validate({**data, "data": rows})
+    # Ten players leave, one enters at the top and everyone else moves down a row.
+    entered = {**rows[0], "name": "newcomer#0001", "steamName": "", "xboxName": "", "psnName": ""}
+    new = model.model_validate({**data, "data": [entered, *rows[10:]]})
+    return old, new
+
+
+def _names(result):
+    return ([getattr(player, field) for field in indexing.NAME_FIELDS] for player in result.players)
+
+
+def _rows(index, name):
+    return [appearance.row for appearance in index.find(name) if (appearance.leaderboard, appearance.platform) == BOARD]
+
+
+def test_apply_changes_moves_base_postings():
+    old, new = _results()
+    index = indexing.PlayerIndex.build([(*BOARD, _names(old))])
+
+    index.apply_changes(*BOARD, old.diff(new).changes, _names(new))
+
+    assert _rows(index, "newcomer#0001") == [0]
+    assert _rows(index, new.players[50].name) == [50]
+    assert _rows(index, old.players[0].name) == []
+
+
+def test_apply_changes_indexes_unknown_board_in_full():
+    old, new = _results()
+    index = indexing.PlayerIndex.build([(api.Leaderboard.S7, api.Platform.CROSSPLAY, [["someone#0001"]])])
+
+    index.apply_changes(*BOARD, old.diff(new).changes, _names(new))
+
+    # Players who stayed aren't in the changes, they come from the rows of the new board.
+    assert _rows(index, new.players[50].name) == [50]
+    assert _rows(index, "newcomer#0001") == [0]
+    assert len(index.find("someone#0001")) == 1
+
+
+def test_player_index_rebuilt_for_other_static_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("THE_FINALS_LEADERBOARD_CACHE", str(tmp_path))
+    old, _ = _results()
+
+    caching.save_player_index(indexing.PlayerIndex.build([(*BOARD, _names(old))], bundle="other"))
+    with pytest.raises(ValueError):
+        caching.load_player_index()
+
+    caching.save_player_index(indexing.PlayerIndex.build([(*BOARD, _names(old))], bundle=caching.static_fingerprint()))
+    index = caching.load_player_index()
+    assert index.bundle == caching.static_fingerprint()
+    assert _rows(index, old.players[3].name) == [3]
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from the_finals_leaderboard import caching
+from the_finals_leaderboard.streaming import LeaderboardParser
+
+BUNDLED = "leaderboard_ob_psn.json.gz"  # Small enough to feed a byte at a time
+# Multi-byte characters (two, three and four bytes in UTF-8) and numbers right before a chunk could end.
+SMALL = json.dumps(
+    {"meta": {"leaderboardVersion": "s8"}, "data": [{"rank": 12345, "name": "Ünï€😀#0001"}, {"rank": 67890}], "count": 24680},
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def _chunks(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _parse(chunks):
+    parser = LeaderboardParser()
+    rows = []
+    for chunk in chunks:
+        rows.extend(parser.feed(chunk))
+    rows.extend(parser.close())
+    return rows, parser.extra
+
+
+def _expected(body):
+    data = json.loads(body)
+    return data.pop("data"), data
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_bundled_board_in_chunks(size):
+    body = caching.load_static_bytes(BUNDLED)
+
+    assert _parse(_chunks(body, size)) == _expected(body)
+
+
+def test_split_at_every_byte():
+    # Covers a number split across chunks and every split of a multi-byte character.
+    for i in range(len(SMALL) + 1):
+        assert _parse([SMALL[:i], SMALL[i:]]) == _expected(SMALL), i
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+@pytest.mark.parametrize("end", [-1, -20, len(SMALL) // 2, SMALL.index("😀".encode("utf-8")) + 2])
+def test_truncated_body(size, end):
+    with pytest.raises(ValueError):
+        _parse(_chunks(SMALL[:end], size))
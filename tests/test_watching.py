@@ -0,0 +1,123 @@
+import asyncio
+import json
+import random
+
+from the_finals_leaderboard import api, client
+
+BOARD = (api.Leaderboard.S9, api.Platform.CROSSPLAY)
+PATH = "/v1/leaderboard/s9/crossplay"
+
+
+class FakeClock():
+    """Time only moves when the test advances it, sleepers wake up once their time has come."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._sleepers: list[tuple[float, asyncio.Future]] = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        future = asyncio.get_running_loop().create_future()
+        self._sleepers.append((self.now + seconds, future))
+        await future
+
+    def advance(self, seconds):
+        self.now += seconds
+        for due, future in list(self._sleepers):
+            if due <= self.now:
+                self._sleepers.remove((due, future))
+                if not future.done():
+                    future.set_result(None)
+
+
+def _swap_top_players(stub):
+    data = json.loads(stub.body(PATH))
+    top = data["data"]
+    top[0], top[1] = top[1], top[0]
+    top[0]["rank"], top[1]["rank"] = 1, 2
+    stub._bodies[PATH] = json.dumps(data).encode("utf-8")
+
+
+async def _scheduled_at(watcher, due):
+    async def wait():
+        while watcher.next_poll(*BOARD) != due:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait(), 30)
+
+
+async def _next_event(subscription):
+    return await asyncio.wait_for(subscription.__anext__(), 30)
+
+
+def test_watcher_publishes_changes_and_backs_off(stub):
+    clock = FakeClock()
+    c = client.Client(url=stub.url)
+    watcher = c.watch([BOARD], interval=10, jitter=0, max_interval=40, clock=clock, sleep=clock.sleep, rng=random.Random(0))
+    subscription = watcher.subscribe()
+
+    async def main():
+        async with watcher:
+            first = await _next_event(subscription)
+            assert first.diff is None
+            assert first.timestamp == 0
+
+            # Unchanged boards are polled less and less often, up to max_interval.
+            for wait, due in ((10, 30), (20, 70), (40, 110)):
+                await _scheduled_at(watcher, clock.now + wait)
+                clock.advance(wait)
+                await _scheduled_at(watcher, due)
+            assert stub.requests[PATH] == 4
+            assert subscription._queue.empty()
+
+            _swap_top_players(stub)
+            clock.advance(40)
+            changed = await _next_event(subscription)
+            assert changed.timestamp == 110
+            assert len(changed.diff.moved) == 2
+            await _scheduled_at(watcher, 120)  # Back to the base interval
+
+        assert not watcher.running
+        assert [event async for event in subscription] == []
+
+    asyncio.run(main())
+
+
+def test_watcher_polls_due_boards_concurrently(stub):
+    stub.latency = 2.0
+    boards = [BOARD, (api.Leaderboard.S9WORLDTOUR, api.Platform.CROSSPLAY)]
+    paths = ["/v1/leaderboard/s9/crossplay", "/v1/leaderboard/s9worldtour/crossplay"]
+    clock = FakeClock()
+    watcher = client.Client(url=stub.url).watch(boards, interval=10, clock=clock, sleep=clock.sleep)
+
+    async def main():
+        async with watcher:
+            # Both requests are sent before the first one gets its (slow) response.
+            async def both_sent():
+                while not all(stub.requests.get(path) for path in paths):
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(both_sent(), stub.latency * 0.75)
+
+    asyncio.run(main())
+
+
+def test_watcher_sees_changes_fetched_by_other_readers(stub):
+    c = client.Client(url=stub.url)
+    watcher = c.watch([BOARD], interval=10)
+
+    async def main():
+        assert (await watcher.poll(BOARD)).diff is None
+
+        # The client picks up the change first, the watcher's own request then only gets a 304.
+        _swap_top_players(stub)
+        await c.get_leaderboard_async(*BOARD, True)
+        changed = await watcher.poll(BOARD)
+
+        assert changed is not None
+        assert len(changed.diff.moved) == 2
+        assert await watcher.poll(BOARD) is None
+
+    asyncio.run(main())